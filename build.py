@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Build a standalone Dating Profile Optimizer bundle with Nuitka
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent
+OUTPUT_DIR = PROJECT_DIR / "dist"
+
+def build():
+    """Compile main.py and the src package into a standalone bundle"""
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "nuitka",
+            "--standalone",
+            "--enable-plugin=tk-inter",
+            "--include-package=src",
+            "--lto=yes",
+            "--python-flag=no_site",
+            f"--output-dir={OUTPUT_DIR}",
+            str(PROJECT_DIR / "main.py")
+        ], cwd=PROJECT_DIR)
+        print(f"Standalone build written to {OUTPUT_DIR}")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Build failed: {e}")
+        print("Make sure Nuitka is installed: pip install nuitka")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if build() else 1)
\ No newline at end of file
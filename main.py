@@ -4,41 +4,73 @@ Dating Profile Optimizer
 A comprehensive application to optimize dating profiles using local AI models
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import threading
 from pathlib import Path
 
-from src.gui.main_window import MainWindow
 from src.utils.logger import setup_logger
-from src.models.model_manager import ModelManager
+
+APP_TITLE = "Dating Profile Optimizer"
+WINDOW_GEOMETRY = "1200x800"
 
 class DatingProfileApp:
     def __init__(self):
+        # Tk is imported here rather than at module level so that importing
+        # main (e.g. from the test runner) does not load it
+        import tkinter as tk
+        
         self.root = tk.Tk()
-        self.root.title("Dating Profile Optimizer")
-        self.root.geometry("1200x800")
+        self.root.title(APP_TITLE)
+        self.root.geometry(WINDOW_GEOMETRY)
         
         # Setup logging
         self.logger = setup_logger()
         self.logger.info("Starting Dating Profile Optimizer")
         
-        # Initialize model manager
-        self.model_manager = ModelManager()
+        # Single long-lived worker for model loading and inference
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="infer")
+        
+        # Paint the empty window before the heavy components are built
+        self.root.update_idletasks()
         
-        # Create main window
-        self.main_window = MainWindow(self.root, self.model_manager, self.logger)
+        self.model_manager = None
+        self.main_window = None
+        self.root.after(50, self._init_heavy)
+    
+    def _init_heavy(self):
+        """Create the model manager and main window once the root window is visible"""
+        # Errors in Tk callbacks never reach run(), so report them here
+        from tkinter import messagebox
+        
+        try:
+            from src.gui import MainWindow
+            from src.models.model_manager import ModelManager
+            
+            # Initialize model manager
+            self.model_manager = ModelManager()
+            
+            # Create main window
+            self.main_window = MainWindow(self.root, self.model_manager, self.logger, self.executor)
+        except Exception as e:
+            self.logger.error(f"Application error: {str(e)}")
+            messagebox.showerror("Error", f"Application error: {str(e)}")
+            self.root.destroy()
         
     def run(self):
         """Start the application"""
+        # Resolve the error dialog up front so the failure path does no imports
+        from tkinter import messagebox
+        show_error = messagebox.showerror
+        
         try:
             self.root.mainloop()
         except Exception as e:
             self.logger.error(f"Application error: {str(e)}")
-            messagebox.showerror("Error", f"Application error: {str(e)}")
+            show_error("Error", f"Application error: {str(e)}")
+        finally:
+            self.executor.shutdown(wait=False)
 
 if __name__ == "__main__":
     app = DatingProfileApp()
@@ -4,7 +4,6 @@ Simple launcher script for the Dating Profile Optimizer
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add src directory to Python path
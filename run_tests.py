@@ -4,33 +4,57 @@ Main test runner script
 """
 
 import sys
+import hashlib
+import runpy
 import subprocess
 from pathlib import Path
 
+PROJECT_DIR = Path(__file__).parent
+REQUIREMENTS_FILE = PROJECT_DIR / "test_requirements.txt"
+REQUIREMENTS_MARKER = PROJECT_DIR / ".cache" / "test_reqs.sha256"
+
 def install_test_requirements():
-    """Install test requirements"""
+    """Install test requirements, skipping pip if they are unchanged since the last install"""
     try:
+        # A different interpreter or virtualenv needs its own install
+        requirements_hash = hashlib.sha256(
+            f"{sys.executable}\n{sys.version}\n".encode() + REQUIREMENTS_FILE.read_bytes()
+        ).hexdigest()
+        
+        if REQUIREMENTS_MARKER.exists() and REQUIREMENTS_MARKER.read_text().strip() == requirements_hash:
+            print("Test requirements already installed")
+            return True
+        
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", "test_requirements.txt"
+            sys.executable, "-m", "pip", "install", "-q", "--disable-pip-version-check",
+            "-r", str(REQUIREMENTS_FILE)
         ])
+        
+        REQUIREMENTS_MARKER.parent.mkdir(exist_ok=True)
+        REQUIREMENTS_MARKER.write_text(requirements_hash)
         print("Test requirements installed successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Failed to install test requirements: {e}")
         return False
 
-def run_tests():
-    """Run the test suite"""
+def run_tests(isolated=False):
+    """Run the test suite, in-process unless isolated is requested"""
     try:
-        # Change to project directory
-        project_dir = Path(__file__).parent
-        
-        # Run tests
-        result = subprocess.run([
-            sys.executable, "-m", "tests.test_runner"
-        ], cwd=project_dir)
+        if isolated:
+            # Run tests in a fresh interpreter
+            result = subprocess.run([
+                sys.executable, "-m", "tests.test_runner"
+            ], cwd=PROJECT_DIR)
+            
+            return result.returncode == 0
         
-        return result.returncode == 0
+        # Run tests in this interpreter to avoid a second startup
+        try:
+            runpy.run_module("tests.test_runner", run_name="__main__")
+            return True
+        except SystemExit as e:
+            return e.code == 0
         
     except Exception as e:
         print(f"Error running tests: {e}")
@@ -47,7 +71,7 @@ def main():
         print("Failed to install test requirements. Continuing anyway...")
     
     print("\nRunning tests...")
-    success = run_tests()
+    success = run_tests(isolated="--isolated" in sys.argv[1:])
     
     if success:
         print("\n✅ All tests passed!")
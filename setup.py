@@ -10,6 +10,9 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+with open("test_requirements.txt", "r", encoding="utf-8") as fh:
+    test_requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+
 setup(
     name="dating-profile-optimizer",
     version="1.0.0",
@@ -17,7 +20,7 @@ setup(
     description="AI-powered dating profile optimization using local models",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
@@ -31,6 +34,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "test": test_requirements,
+    },
     entry_points={
         "console_scripts": [
             "dating-profile-optimizer=main:main",
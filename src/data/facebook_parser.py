@@ -3,41 +3,172 @@ Facebook Data Export Parser
 Processes Facebook data export JSON files to extract profile information and photos
 """
 
+import functools
+import hashlib
 import json
 import logging
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
+from collections import defaultdict
+from itertools import islice, starmap
+from operator import itemgetter
+from types import MappingProxyType
 from datetime import datetime
 import re
 import zipfile
 import shutil
+import sys
 import tempfile
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Below this much JSON in total, starting worker processes and pickling their
+# results back costs more than parsing in-process
+PARALLEL_PARSE_MIN_BYTES = 32 * 1024 * 1024
+
+# Export file classifiers, matched against the path relative to the extraction
+# directory. Kind alternatives are tried in priority order; all but 'album' must
+# appear in the file name itself.
+_POSTS_FILE_RE = re.compile(r".*your_posts__check_ins__photos[^/\\]*$", re.IGNORECASE)
+_FILE_KIND_RE = re.compile(
+    r"(?P<photos>(?=.*album|.*your_uncategorized_photos[^/\\]*$))"
+    r"|(?P<interests>(?=.*pages_you(?:'ve|_have)_liked[^/\\]*$))"
+    r"|(?P<comments>(?=.*comments[^/\\]*$))",
+    re.IGNORECASE
+)
+
+# Section classifier for single-file JSON exports; the group names are the
+# processed_data keys, tried in priority order
+_DATA_KEY_KIND_RE = re.compile(
+    r"(?P<profile_info>(?=.*profile))"
+    r"|(?P<photos>(?=.*photo))"
+    r"|(?P<posts>(?=.*(?:post|status)))"
+    r"|(?P<friends>(?=.*friend))"
+    r"|(?P<interests>(?=.*(?:like|page)))"
+    r"|(?P<work_education>(?=.*(?:work|education)))",
+    re.IGNORECASE | re.ASCII | re.DOTALL
+)
+
+# Shared read-only default for chained .get() lookups, so misses and nulls
+# allocate nothing
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Fetches all three birthday parts in one call; raises KeyError if any is missing
+_BIRTHDAY_FIELDS = itemgetter('year', 'month', 'day')
+
+# Activity verbs that mean the start of a post title is not the poster's name
+_ACTIVITY_WORD_RE = re.compile(r"shared|posted|updated", re.IGNORECASE | re.ASCII)
+
+# Threads used to extract ZIP members; zlib releases the GIL while inflating
+EXTRACT_WORKERS = 8
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+# Array files at least this large are streamed item by item instead of loaded whole
+STREAMING_MIN_BYTES = 1024 * 1024
+
+# JSON files at least this large are memory-mapped rather than read into memory
+MMAP_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _read_json(json_path) -> Any:
+    """Load a JSON file from its raw bytes, using orjson when it is installed"""
+    with open(json_path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        
+        # Map very large files instead of copying them into one big bytes object
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        
+        return orjson.loads(f.read())
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_timestamp(timestamp) -> str:
+    """Format a Unix timestamp as local ISO time; comments and reactions repeat them"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _log_parse_errors(description: str, default_factory):
+    """Decorate a per-file parser to log failures and return an empty result"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, json_file, *args, **kwargs):
+            try:
+                return method(self, json_file, *args, **kwargs)
+            except Exception as e:
+                self.logger.error(f"Error parsing {description} from {json_file}: {str(e)}")
+                return default_factory()
+        return wrapper
+    return decorator
+
+
+# Parser reused by every task in a worker process, seeded with the file index
+_worker_parser = None
+
+
+def _init_parse_worker(file_index_root: str, file_index: Dict[str, List[str]]):
+    """Process pool initializer that hands each worker the export's file index"""
+    global _worker_parser
+    _worker_parser = FacebookDataParser()
+    _worker_parser._set_file_index(file_index_root, file_index)
+
+
+def _parse_export_file(task: Tuple[Tuple[str, ...], str, Path]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """Worker entry point; module-level so it can be pickled for the process pool"""
+    parser = _worker_parser or FacebookDataParser()
+    return parser._parse_export_file(*task)
+
 
 class FacebookDataParser:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.supported_formats = ['.json', '.zip']
         
-    def parse_facebook_export(self, file_path: str) -> Dict[str, Any]:
+        # File name -> paths under _file_index_root, used to locate photos
+        self._set_file_index(None, {})
+        
+    def parse_facebook_export(self, file_path: str,
+                              progress_callback: Optional[Callable[[float], None]] = None) -> Dict[str, Any]:
         """
         Parse Facebook data export file
         
         Args:
             file_path: Path to Facebook export file (.json or .zip)
+            progress_callback: Called with the fraction (0-1) of the export's JSON parsed so far
             
         Returns:
             Dictionary containing parsed Facebook data
         """
         try:
             file_path = Path(file_path)
+            self._set_file_index(None, {})
             
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
             if file_path.suffix.lower() == '.zip':
-                return self._parse_zip_export(file_path)
+                return self._parse_zip_export(file_path, progress_callback)
             elif file_path.suffix.lower() == '.json':
-                return self._parse_json_export(file_path)
+                parsed_data = self._parse_json_export(file_path)
+                if progress_callback is not None:
+                    progress_callback(1.0)
+                return parsed_data
             else:
                 raise ValueError(f"Unsupported file format: {file_path.suffix}")
                 
@@ -45,23 +176,41 @@ class FacebookDataParser:
             self.logger.error(f"Error parsing Facebook export: {str(e)}")
             raise
     
-    def _parse_zip_export(self, zip_path: Path) -> Dict[str, Any]:
+    def _parse_zip_export(self, zip_path: Path,
+                          progress_callback: Optional[Callable[[float], None]] = None) -> Dict[str, Any]:
         """Parse Facebook ZIP export"""
         self.logger.info(f"Parsing Facebook ZIP export: {zip_path}")
         
-        # Create a permanent extraction directory
-        extract_dir = Path("temp_facebook_data")
-        extract_dir.mkdir(exist_ok=True)
-        
-        # Clean up any existing extraction
-        if extract_dir.exists():
-            shutil.rmtree(extract_dir)
-        extract_dir.mkdir()
+        # Extract to a permanent directory keyed on the export, so re-importing
+        # the same ZIP reuses the files extracted last time
+        extract_root = Path("temp_facebook_data")
+        stat = zip_path.stat()
+        export_key = hashlib.blake2b(
+            f"{zip_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+        extract_dir = extract_root / export_key
+        complete_marker = extract_root / f"{export_key}.complete"
         
+        zip_ref = None
         try:
-            # Extract ZIP file to permanent location
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            # The central directory lists every file without decompressing anything
+            zip_ref = zipfile.ZipFile(zip_path, 'r')
+            members = self._zip_members(zip_ref, extract_dir)
+            
+            if complete_marker.exists():
+                self.logger.info(f"Reusing extracted export: {extract_dir}")
+                zip_ref.close()
+                zip_ref = None
+            else:
+                # Only one export is kept extracted; clear out any previous one
+                if extract_root.exists():
+                    shutil.rmtree(extract_root)
+                extract_dir.mkdir(parents=True)
+                
+                # Photos are extracted after parsing, once we know which are referenced
+                self._extract_members(zip_ref, [(info, target) for target, info in members.items()
+                                                if target.endswith('.json')])
             
             # Find and parse relevant JSON files
             parsed_data = {
@@ -75,215 +224,380 @@ class FacebookDataParser:
                 'extraction_path': str(extract_dir)  # Store extraction path
             }
             
-            # Look for Facebook export files in the new structure
-            json_files = list(extract_dir.rglob('*.json'))
-            
-            for json_file in json_files:
-                file_name = json_file.name.lower()
-                relative_path = str(json_file.relative_to(extract_dir)).lower()
+            # Index every file for photo lookups and classify the JSON files up
+            # front so they can be parsed independently
+            tasks = []
+            file_index = defaultdict(list)
+            prefix_len = len(os.path.join(extract_dir, ''))
+            for target in members:
+                relative_path = target[prefix_len:]
+                file_index[os.path.basename(target)].append(target)
+                if not target.endswith('.json'):
+                    continue
                 
                 # Parse posts for profile information (do this first to extract name)
-                if 'your_posts__check_ins__photos' in file_name:
-                    parsed_data['posts'].extend(self._parse_new_posts(json_file))
+                kinds = []
+                if _POSTS_FILE_RE.match(relative_path):
+                    kinds.append('posts')
                 
-                # Parse photos from various sources
-                if ('your_uncategorized_photos' in file_name or 
-                    'album' in relative_path):
-                    parsed_data['photos'].extend(self._parse_new_photos(json_file, extract_dir))
+                # Parse photos, liked pages and comments
+                match = _FILE_KIND_RE.match(relative_path)
+                if match:
+                    kinds.append(match.lastgroup)
                 
-                # Parse interests from liked pages
-                elif 'pages_you\'ve_liked' in file_name or 'pages_you_have_liked' in file_name:
-                    parsed_data['interests'].extend(self._parse_new_interests(json_file))
-                
-                # Parse other data sources
-                elif 'comments' in file_name:
-                    parsed_data['posts'].extend(self._parse_comments_for_profile(json_file))
+                # A file of several kinds is one task, so it is only read once
+                if kinds:
+                    tasks.append((tuple(kinds), target, extract_dir))
+            
+            self._set_file_index(str(extract_dir), dict(file_index))
+            
+            for key, results in self._run_parse_tasks(tasks, progress_callback):
+                parsed_data[key].extend(results)
+            
+            if zip_ref is not None:
+                # Extract only the photos the export refers to
+                referenced = dict.fromkeys(photo['local_path'] for photo in parsed_data['photos']
+                                           if photo.get('local_path') in members)
+                self._extract_members(zip_ref, [(members[target], target) for target in referenced])
+                complete_marker.touch()
             
             return parsed_data
             
         except Exception as e:
             # Clean up on error
+            if complete_marker.exists():
+                complete_marker.unlink()
             if extract_dir.exists():
                 shutil.rmtree(extract_dir, ignore_errors=True)
             raise
+        finally:
+            if zip_ref is not None:
+                zip_ref.close()
+    
+    def _zip_members(self, zip_ref: zipfile.ZipFile, extract_dir: Path) -> Dict[str, zipfile.ZipInfo]:
+        """Map the extraction target of every file in the ZIP to its member info"""
+        members = {}
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            
+            target = self._zip_member_target(info.filename, extract_dir)
+            if target is not None:
+                members[target] = info
+        
+        return members
+    
+    def _extract_members(self, zip_ref: zipfile.ZipFile, members: List[Tuple[zipfile.ZipInfo, str]]):
+        """Extract the given (member, target) pairs, copying files on a small thread pool"""
+        if not members:
+            return
+        
+        # Create directories up front so worker threads never race on them
+        for directory in {os.path.dirname(target) for _, target in members}:
+            os.makedirs(directory, exist_ok=True)
+        
+        def extract_member(item):
+            member, target = item
+            with zip_ref.open(member) as source, open(target, 'wb') as dest:
+                shutil.copyfileobj(source, dest, EXTRACT_BUFFER_SIZE)
+        
+        with ThreadPoolExecutor(max_workers=min(EXTRACT_WORKERS, len(members))) as executor:
+            list(executor.map(extract_member, members))
+    
+    def _zip_member_target(self, filename: str, extract_dir: Path) -> Optional[str]:
+        """Map a ZIP member name to a path inside extract_dir, sanitized like extractall"""
+        arcname = filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        
+        parts = [part for part in arcname.split(os.path.sep)
+                 if part not in ('', os.path.curdir, os.path.pardir)]
+        if not parts:
+            return None
+        
+        return os.path.join(extract_dir, *parts)
+    
+    def _run_parse_tasks(self, tasks: List[Tuple[Tuple[str, ...], str, Path]],
+                         progress_callback: Optional[Callable[[float], None]] = None) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Parse classified export files, spreading large exports across processes"""
+        sizes = [os.path.getsize(task[1]) for task in tasks]
+        max_workers = min(os.cpu_count() or 1, len(tasks))
+        if max_workers < 2 or sum(sizes) < PARALLEL_PARSE_MIN_BYTES:
+            return self._collect_parse_results(starmap(self._parse_export_file, tasks), sizes, progress_callback)
+        
+        try:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                     initializer=_init_parse_worker,
+                                     initargs=(self._file_index_root, self._file_index)) as executor:
+                return self._collect_parse_results(executor.map(_parse_export_file, tasks), sizes, progress_callback)
+        except Exception as e:
+            self.logger.warning(f"Parallel parsing failed, parsing sequentially: {str(e)}")
+            return self._collect_parse_results(starmap(self._parse_export_file, tasks), sizes, progress_callback)
+    
+    def _collect_parse_results(self, results: Iterator[List[Tuple[str, List[Dict[str, Any]]]]], sizes: List[int],
+                               progress_callback: Optional[Callable[[float], None]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Drain parse results in task order, reporting the share of JSON bytes parsed after each file"""
+        if progress_callback is None:
+            return [pair for result in results for pair in result]
+        
+        collected = []
+        total = sum(sizes) or 1
+        done = 0
+        for result, size in zip(results, sizes):
+            collected.extend(result)
+            done += size
+            progress_callback(done / total)
+        
+        return collected
+    
+    def _parse_export_file(self, kinds: Tuple[str, ...], json_file: str,
+                           extract_dir: Path) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Parse a single classified export file into (parsed_data key, entries) pairs"""
+        # Load a file needed by several parsers once, unless it is big enough to be streamed
+        data = None
+        if len(kinds) > 1 and (ijson is None or os.path.getsize(json_file) < STREAMING_MIN_BYTES):
+            try:
+                data = self._load_json(json_file)
+            except (OSError, ValueError):
+                # Each parser then reports the unreadable file itself
+                data = None
+        
+        return [self._parse_export_kind(kind, json_file, extract_dir, data) for kind in kinds]
+    
+    def _parse_export_kind(self, kind: str, json_file: str, extract_dir: Path,
+                           data: Any = None) -> Tuple[str, List[Dict[str, Any]]]:
+        """Parse an export file as one kind, from its loaded contents when given"""
+        if kind == 'posts':
+            return 'posts', self._parse_new_posts(json_file, data)
+        elif kind == 'photos':
+            return 'photos', self._parse_new_photos(json_file, extract_dir, data)
+        elif kind == 'interests':
+            return 'interests', self._parse_new_interests(json_file, data)
+        else:
+            return 'posts', self._parse_comments_for_profile(json_file, data)
+    
+    def _iter_files(self, root) -> Iterator[os.DirEntry]:
+        """Recursively yield directory entries for the files under root"""
+        # An explicit stack avoids chaining nested generators for deep trees
+        stack = [root]
+        while stack:
+            subdirs = []
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        yield entry
+            
+            # Files in a directory come before its subdirectories, as with rglob
+            stack.extend(reversed(subdirs))
     
     def _parse_json_export(self, json_path: Path) -> Dict[str, Any]:
         """Parse single Facebook JSON export file"""
         self.logger.info(f"Parsing Facebook JSON export: {json_path}")
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self._load_json(json_path)
         
         # Process the JSON data based on its structure
         return self._process_json_data(data, json_path.parent)
     
+    def _load_json(self, json_path: Path) -> Any:
+        """Load a JSON file, using orjson when it is installed"""
+        return _read_json(json_path)
+    
+    def _iter_json_items(self, json_path: Path, prefix: str = 'item', data: Any = None) -> Iterator[Any]:
+        """
+        Yield the values at an ijson-style prefix such as 'photos_v2.item', from
+        data if the file is already loaded, otherwise streaming large files with ijson
+        """
+        if data is None:
+            if ijson is not None and os.path.getsize(json_path) >= STREAMING_MIN_BYTES:
+                with open(json_path, 'rb') as f:
+                    yield from ijson.items(f, prefix, use_float=True)
+                return
+            
+            data = self._load_json(json_path)
+        
+        yield from self._json_prefix_values(data, prefix)
+    
+    def _iter_json_sections(self, json_path: Path, prefixes: Tuple[str, ...],
+                            data: Any = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (prefix, value) pairs for several ijson-style prefixes, reading
+        the file once; streamed values arrive in document order
+        """
+        if data is None and ijson is not None and os.path.getsize(json_path) >= STREAMING_MIN_BYTES:
+            with open(json_path, 'rb') as f:
+                events = ijson.parse(f, use_float=True)
+                for current, event, value in events:
+                    if current not in prefixes:
+                        continue
+                    
+                    if event in ('start_map', 'start_array'):
+                        # Build the container from its events, as ijson.items does
+                        section = current
+                        end_event = event.replace('start', 'end')
+                        builder = ijson.ObjectBuilder()
+                        while (current, event) != (section, end_event):
+                            builder.event(event, value)
+                            current, event, value = next(events)
+                        yield section, builder.value
+                    else:
+                        yield current, value
+            return
+        
+        if data is None:
+            data = self._load_json(json_path)
+        for prefix in prefixes:
+            for value in self._json_prefix_values(data, prefix):
+                yield prefix, value
+    
+    @staticmethod
+    def _json_prefix_values(data: Any, prefix: str) -> Iterator[Any]:
+        """Yield the values of a loaded JSON document at an ijson-style prefix"""
+        *keys, last = prefix.split('.')
+        for key in keys:
+            if not isinstance(data, dict) or key not in data:
+                return
+            data = data[key]
+        
+        if last == 'item':
+            if isinstance(data, list):
+                yield from data
+        elif isinstance(data, dict) and last in data:
+            yield data[last]
+    
+    @_log_parse_errors('profile info', dict)
     def _parse_profile_info(self, json_file: Path) -> Dict[str, Any]:
         """Parse profile information from JSON file"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            profile_info = {}
-            
-            # Extract basic profile information
-            if 'profile_v2' in data:
-                profile_data = data['profile_v2']
-                profile_info.update({
-                    'name': profile_data.get('name', {}).get('full_name', ''),
-                    'birthday': self._parse_birthday(profile_data.get('birthday')),
-                    'gender': profile_data.get('gender', {}).get('pronoun', ''),
-                    'location': self._parse_location(profile_data.get('current_city')),
-                    'hometown': self._parse_location(profile_data.get('hometown')),
-                    'relationship_status': profile_data.get('relationship', {}).get('status', ''),
-                    'bio': profile_data.get('bio', {}).get('text', ''),
-                    'website': profile_data.get('website', ''),
-                    'email': profile_data.get('email', ''),
-                    'phone': profile_data.get('phone', '')
-                })
-            
-            return profile_info
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing profile info from {json_file}: {str(e)}")
-            return {}
+        data = self._load_json(json_file)
+        
+        profile_info = {}
+        
+        # Extract basic profile information
+        if 'profile_v2' in data:
+            profile_data = data['profile_v2']
+            profile_info.update({
+                'name': (profile_data.get('name') or _EMPTY_MAPPING).get('full_name', ''),
+                'birthday': self._parse_birthday(profile_data.get('birthday')),
+                'gender': (profile_data.get('gender') or _EMPTY_MAPPING).get('pronoun', ''),
+                'location': self._parse_location(profile_data.get('current_city')),
+                'hometown': self._parse_location(profile_data.get('hometown')),
+                'relationship_status': (profile_data.get('relationship') or _EMPTY_MAPPING).get('status', ''),
+                'bio': (profile_data.get('bio') or _EMPTY_MAPPING).get('text', ''),
+                'website': profile_data.get('website', ''),
+                'email': profile_data.get('email', ''),
+                'phone': profile_data.get('phone', '')
+            })
+        
+        return profile_info
     
+    @_log_parse_errors('photos', list)
     def _parse_photos(self, json_file: Path, base_path: Path) -> List[Dict[str, Any]]:
         """Parse photos from JSON file"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            photos = []
-            
-            if 'photos_v2' in data:
-                for photo_data in data['photos_v2']:
-                    photo_info = {
-                        'title': photo_data.get('title', ''),
-                        'description': photo_data.get('description', ''),
-                        'creation_timestamp': self._parse_timestamp(photo_data.get('creation_timestamp')),
-                        'uri': photo_data.get('uri', ''),
-                        'media_metadata': photo_data.get('media_metadata', {}),
-                        'comments': self._parse_comments(photo_data.get('comments', [])),
-                        'reactions': self._parse_reactions(photo_data.get('reactions', [])),
-                        'local_path': self._find_photo_file(photo_data.get('uri', ''), base_path)
-                    }
-                    photos.append(photo_info)
-            
-            return photos
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing photos from {json_file}: {str(e)}")
-            return []
+        photos = []
+        parse_timestamp = self._parse_timestamp
+        parse_comments = self._parse_comments
+        parse_reactions = self._parse_reactions
+        find_photo_file = self._find_photo_file
+        
+        for photo_data in self._iter_json_items(json_file, 'photos_v2.item'):
+            get = photo_data.get
+            uri = get('uri', '')
+            photos.append({
+                'title': get('title', ''),
+                'description': get('description', ''),
+                'creation_timestamp': parse_timestamp(get('creation_timestamp')),
+                'uri': uri,
+                'media_metadata': get('media_metadata', {}),
+                'comments': parse_comments(get('comments', ())),
+                'reactions': parse_reactions(get('reactions', ())),
+                'local_path': find_photo_file(uri, base_path)
+            })
+        
+        return photos
     
+    @_log_parse_errors('posts', list)
     def _parse_posts(self, json_file: Path) -> List[Dict[str, Any]]:
         """Parse posts/timeline data from JSON file"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            posts = []
-            
-            if 'status_updates' in data:
-                for post_data in data['status_updates']:
-                    post_info = {
-                        'timestamp': self._parse_timestamp(post_data.get('timestamp')),
-                        'data': post_data.get('data', []),
-                        'title': post_data.get('title', ''),
-                        'attachments': post_data.get('attachments', [])
-                    }
-                    posts.append(post_info)
-            
-            return posts
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing posts from {json_file}: {str(e)}")
-            return []
+        posts = []
+        
+        for post_data in self._iter_json_items(json_file, 'status_updates.item'):
+            post_info = {
+                'timestamp': self._parse_timestamp(post_data.get('timestamp')),
+                'data': post_data.get('data', []),
+                'title': post_data.get('title', ''),
+                'attachments': post_data.get('attachments', [])
+            }
+            posts.append(post_info)
+        
+        return posts
     
+    @_log_parse_errors('friends', list)
     def _parse_friends(self, json_file: Path) -> List[Dict[str, Any]]:
         """Parse friends list from JSON file"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            friends = []
-            
-            if 'friends_v2' in data:
-                for friend_data in data['friends_v2']:
-                    friend_info = {
-                        'name': friend_data.get('name', ''),
-                        'timestamp': self._parse_timestamp(friend_data.get('timestamp'))
-                    }
-                    friends.append(friend_info)
-            
-            return friends
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing friends from {json_file}: {str(e)}")
-            return []
+        friends = []
+        
+        friend_list = list(self._iter_json_items(json_file, 'friends_v2.item'))
+        timestamps = self._parse_timestamps_bulk([friend_data.get('timestamp') for friend_data in friend_list])
+        
+        for friend_data, timestamp in zip(friend_list, timestamps):
+            friend_info = {
+                'name': friend_data.get('name', ''),
+                'timestamp': timestamp
+            }
+            friends.append(friend_info)
+        
+        return friends
     
+    @_log_parse_errors('interests', list)
     def _parse_interests(self, json_file: Path) -> List[Dict[str, Any]]:
         """Parse interests/likes from JSON file"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            interests = []
-            
-            # Parse liked pages
-            if 'page_likes_v2' in data:
-                for like_data in data['page_likes_v2']:
-                    interest_info = {
-                        'name': like_data.get('name', ''),
-                        'category': like_data.get('category', ''),
-                        'timestamp': self._parse_timestamp(like_data.get('timestamp'))
-                    }
-                    interests.append(interest_info)
-            
-            return interests
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing interests from {json_file}: {str(e)}")
-            return []
+        interests = []
+        
+        # Parse liked pages
+        for like_data in self._iter_json_items(json_file, 'page_likes_v2.item'):
+            interest_info = {
+                'name': like_data.get('name', ''),
+                'category': like_data.get('category', ''),
+                'timestamp': self._parse_timestamp(like_data.get('timestamp'))
+            }
+            interests.append(interest_info)
+        
+        return interests
     
+    @_log_parse_errors('work/education', list)
     def _parse_work_education(self, json_file: Path) -> List[Dict[str, Any]]:
         """Parse work and education information"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            work_education = []
-            
-            # Parse work experience
-            if 'work_v2' in data:
-                for work_data in data['work_v2']:
-                    work_info = {
-                        'type': 'work',
-                        'employer': work_data.get('employer', ''),
-                        'position': work_data.get('position', ''),
-                        'location': work_data.get('location', ''),
-                        'start_timestamp': self._parse_timestamp(work_data.get('start_timestamp')),
-                        'end_timestamp': self._parse_timestamp(work_data.get('end_timestamp'))
-                    }
-                    work_education.append(work_info)
-            
-            # Parse education
-            if 'education_v2' in data:
-                for edu_data in data['education_v2']:
-                    edu_info = {
-                        'type': 'education',
-                        'school': edu_data.get('school', ''),
-                        'degree': edu_data.get('degree', ''),
-                        'field_of_study': edu_data.get('field_of_study', ''),
-                        'start_timestamp': self._parse_timestamp(edu_data.get('start_timestamp')),
-                        'end_timestamp': self._parse_timestamp(edu_data.get('end_timestamp'))
-                    }
-                    work_education.append(edu_info)
-            
-            return work_education
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing work/education from {json_file}: {str(e)}")
-            return []
+        work = []
+        education = []
+        
+        # Both sections come from one pass over the file; work is listed first
+        for section, item in self._iter_json_sections(json_file, ('work_v2.item', 'education_v2.item')):
+            if section == 'work_v2.item':
+                # Parse work experience
+                work.append({
+                    'type': 'work',
+                    'employer': item.get('employer', ''),
+                    'position': item.get('position', ''),
+                    'location': item.get('location', ''),
+                    'start_timestamp': self._parse_timestamp(item.get('start_timestamp')),
+                    'end_timestamp': self._parse_timestamp(item.get('end_timestamp'))
+                })
+            else:
+                # Parse education
+                education.append({
+                    'type': 'education',
+                    'school': item.get('school', ''),
+                    'degree': item.get('degree', ''),
+                    'field_of_study': item.get('field_of_study', ''),
+                    'start_timestamp': self._parse_timestamp(item.get('start_timestamp')),
+                    'end_timestamp': self._parse_timestamp(item.get('end_timestamp'))
+                })
+        
+        return work + education
     
     def _parse_birthday(self, birthday_data: Optional[Dict]) -> Optional[str]:
         """Parse birthday information"""
@@ -291,12 +605,10 @@ class FacebookDataParser:
             return None
         
         try:
-            if 'year' in birthday_data and 'month' in birthday_data and 'day' in birthday_data:
-                return f"{birthday_data['year']}-{birthday_data['month']:02d}-{birthday_data['day']:02d}"
-        except:
-            pass
-        
-        return None
+            year, month, day = _BIRTHDAY_FIELDS(birthday_data)
+            return f"{year}-{month:02d}-{day:02d}"
+        except (KeyError, TypeError, ValueError):
+            return None
     
     def _parse_location(self, location_data: Optional[Dict]) -> Optional[str]:
         """Parse location information"""
@@ -311,66 +623,99 @@ class FacebookDataParser:
             return None
         
         try:
-            return datetime.fromtimestamp(timestamp).isoformat()
-        except:
+            return _format_timestamp(timestamp)
+        except (TypeError, ValueError, OverflowError, OSError):
             return None
     
+    def _parse_timestamps_bulk(self, timestamps: List[Optional[int]]) -> List[Optional[str]]:
+        """Parse a list of Unix timestamps, vectorized with NumPy when the result is identical"""
+        valid = [ts for ts in timestamps if ts]
+        if not valid or not all(type(ts) is int for ts in valid):
+            return [self._parse_timestamp(ts) for ts in timestamps]
+        
+        # Importing NumPy just for this costs more than it saves; the app has
+        # usually loaded it already for the models
+        np = sys.modules.get('numpy')
+        if np is None:
+            return [self._parse_timestamp(ts) for ts in timestamps]
+        
+        try:
+            # datetime64 has no time zones, so only UTC can be converted in bulk; other
+            # zones may have changed their offset in the past and go through fromtimestamp
+            if (time.timezone or time.daylight
+                    or time.localtime(min(valid)).tm_gmtoff or time.localtime(max(valid)).tm_gmtoff):
+                raise ValueError("local time zone is not UTC")
+            
+            parsed = iter(np.asarray(valid, dtype='int64').astype('datetime64[s]').astype(str).tolist())
+        except (ValueError, OverflowError, OSError):
+            return [self._parse_timestamp(ts) for ts in timestamps]
+        
+        return [next(parsed) if ts else None for ts in timestamps]
+    
     def _parse_comments(self, comments_data: List[Dict]) -> List[Dict[str, Any]]:
         """Parse comments data"""
-        comments = []
-        for comment in comments_data:
-            comments.append({
-                'author': comment.get('author', ''),
-                'comment': comment.get('comment', ''),
-                'timestamp': self._parse_timestamp(comment.get('timestamp'))
-            })
-        return comments
+        return [{
+            'author': comment.get('author', ''),
+            'comment': comment.get('comment', ''),
+            'timestamp': self._parse_timestamp(comment.get('timestamp'))
+        } for comment in comments_data]
     
     def _parse_reactions(self, reactions_data: List[Dict]) -> List[Dict[str, Any]]:
         """Parse reactions data"""
-        reactions = []
-        for reaction in reactions_data:
-            reactions.append({
-                'reaction': reaction.get('reaction', ''),
-                'actor': reaction.get('actor', '')
-            })
-        return reactions
+        return [{
+            'reaction': reaction.get('reaction', ''),
+            'actor': reaction.get('actor', '')
+        } for reaction in reactions_data]
     
     def _find_photo_file(self, uri: str, base_path: Path) -> Optional[str]:
         """Find the actual photo file in the extracted directory"""
         if not uri:
             return None
         
+        cache_key = (uri, str(base_path))
+        if cache_key not in self._photo_path_cache:
+            self._photo_path_cache[cache_key] = self._locate_photo_file(uri, base_path)
+        
+        return self._photo_path_cache[cache_key]
+    
+    def _locate_photo_file(self, uri: str, base_path: Path) -> Optional[str]:
+        """Resolve a photo URI against base_path, falling back to the file name index"""
+        photo_path = os.path.join(base_path, uri)
+        file_name = os.path.basename(uri)
+        
+        # A ZIP export's index lists every member, including photos not extracted yet,
+        # so these lookups need no stat call
+        if self._file_index_root == str(base_path):
+            matches = self._file_index.get(file_name, [])
+            if photo_path in matches:
+                return photo_path
+            if len(matches) == 1:
+                return matches[0]
+        
         # Facebook URIs are usually relative paths
-        photo_path = base_path / uri
-        if photo_path.exists():
-            return str(photo_path)
-        
-        # Try alternative path structures
-        # Remove leading path components that might not match
-        if '/' in uri:
-            # Try with just the filename
-            filename = Path(uri).name
-            for photo_file in base_path.rglob(filename):
-                return str(photo_file)
-            
-            # Try with the last few path components
-            path_parts = Path(uri).parts
-            if len(path_parts) > 1:
-                # Try last 2 components
-                relative_path = Path(*path_parts[-2:])
-                photo_path = base_path / relative_path
-                if photo_path.exists():
-                    return str(photo_path)
-                
-                # Try last 3 components
-                if len(path_parts) > 2:
-                    relative_path = Path(*path_parts[-3:])
-                    photo_path = base_path / relative_path
-                    if photo_path.exists():
-                        return str(photo_path)
+        if os.path.isfile(photo_path):
+            return photo_path
+        
+        # Otherwise assume the photo was moved and take the first file with its name
+        matches = self._get_file_index(base_path).get(file_name, [])
+        return matches[0] if matches else None
+    
+    def _set_file_index(self, root: Optional[str], file_index: Dict[str, List[str]]):
+        """Replace the file name index and forget photo lookups made against the old one"""
+        self._file_index_root = root
+        self._file_index = file_index
+        self._photo_path_cache = {}
+    
+    def _get_file_index(self, base_path: Path) -> Dict[str, List[str]]:
+        """Return the file name index for base_path, building it with one walk if needed"""
+        if self._file_index_root != str(base_path):
+            file_index = defaultdict(list)
+            if os.path.isdir(base_path):
+                for entry in self._iter_files(base_path):
+                    file_index[entry.name].append(entry.path)
+            self._set_file_index(str(base_path), dict(file_index))
         
-        return None
+        return self._file_index
     
     def _process_json_data(self, data: Dict[str, Any], base_path: Path) -> Dict[str, Any]:
         """Process raw JSON data and extract relevant information"""
@@ -385,20 +730,25 @@ class FacebookDataParser:
             'work_education': []
         }
         
+        extractors = {
+            'photos': lambda value: self._extract_photos_from_data(value, base_path),
+            'posts': self._extract_posts_from_data,
+            'friends': self._extract_friends_from_data,
+            'interests': self._extract_interests_from_data,
+            'work_education': self._extract_work_education_from_data
+        }
+        
         # Try to identify and parse different data types
         for key, value in data.items():
-            if 'profile' in key.lower():
+            match = _DATA_KEY_KIND_RE.match(key)
+            if not match:
+                continue
+            
+            kind = match.lastgroup
+            if kind == 'profile_info':
                 processed_data['profile_info'].update(self._extract_profile_from_data(value))
-            elif 'photo' in key.lower():
-                processed_data['photos'].extend(self._extract_photos_from_data(value, base_path))
-            elif 'post' in key.lower() or 'status' in key.lower():
-                processed_data['posts'].extend(self._extract_posts_from_data(value))
-            elif 'friend' in key.lower():
-                processed_data['friends'].extend(self._extract_friends_from_data(value))
-            elif 'like' in key.lower() or 'page' in key.lower():
-                processed_data['interests'].extend(self._extract_interests_from_data(value))
-            elif 'work' in key.lower() or 'education' in key.lower():
-                processed_data['work_education'].extend(self._extract_work_education_from_data(value))
+            else:
+                processed_data[kind].extend(extractors[kind](value))
         
         return processed_data
     
@@ -417,184 +767,168 @@ class FacebookDataParser:
     
     def _extract_photos_from_data(self, data: Any, base_path: Path) -> List[Dict[str, Any]]:
         """Extract photos from various data structures"""
-        photos = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    photos.append({
-                        'title': item.get('title', ''),
-                        'uri': item.get('uri', ''),
-                        'timestamp': item.get('timestamp', ''),
-                        'local_path': self._find_photo_file(item.get('uri', ''), base_path)
-                    })
-        return photos
+        if not isinstance(data, list):
+            return []
+        
+        return [{
+            'title': item.get('title', ''),
+            'uri': item.get('uri', ''),
+            'timestamp': item.get('timestamp', ''),
+            'local_path': self._find_photo_file(item.get('uri', ''), base_path)
+        } for item in data if isinstance(item, dict)]
     
     def _extract_posts_from_data(self, data: Any) -> List[Dict[str, Any]]:
         """Extract posts from various data structures"""
-        posts = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    posts.append({
-                        'content': item.get('data', []),
-                        'timestamp': item.get('timestamp', ''),
-                        'attachments': item.get('attachments', [])
-                    })
-        return posts
+        if not isinstance(data, list):
+            return []
+        
+        return [{
+            'content': item.get('data', []),
+            'timestamp': item.get('timestamp', ''),
+            'attachments': item.get('attachments', [])
+        } for item in data if isinstance(item, dict)]
     
     def _extract_friends_from_data(self, data: Any) -> List[Dict[str, Any]]:
         """Extract friends from various data structures"""
-        friends = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    friends.append({
-                        'name': item.get('name', ''),
-                        'timestamp': item.get('timestamp', '')
-                    })
-        return friends
+        if not isinstance(data, list):
+            return []
+        
+        return [{
+            'name': item.get('name', ''),
+            'timestamp': item.get('timestamp', '')
+        } for item in data if isinstance(item, dict)]
     
     def _extract_interests_from_data(self, data: Any) -> List[Dict[str, Any]]:
         """Extract interests from various data structures"""
-        interests = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    interests.append({
-                        'name': item.get('name', ''),
-                        'category': item.get('category', ''),
-                        'timestamp': item.get('timestamp', '')
-                    })
-        return interests
+        if not isinstance(data, list):
+            return []
+        
+        return [{
+            'name': item.get('name', ''),
+            'category': item.get('category', ''),
+            'timestamp': item.get('timestamp', '')
+        } for item in data if isinstance(item, dict)]
     
     def _extract_work_education_from_data(self, data: Any) -> List[Dict[str, Any]]:
         """Extract work/education from various data structures"""
-        work_education = []
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    work_education.append({
-                        'type': 'work' if 'employer' in item else 'education',
-                        'name': item.get('employer', item.get('school', '')),
-                        'position': item.get('position', item.get('degree', '')),
-                        'location': item.get('location', ''),
-                        'start_date': item.get('start_timestamp', ''),
-                        'end_date': item.get('end_timestamp', '')
-                    })
-        return work_education
-    
-    def _parse_new_photos(self, json_file: Path, base_path: Path) -> List[Dict[str, Any]]:
+        if not isinstance(data, list):
+            return []
+        
+        return [{
+            'type': 'work' if 'employer' in item else 'education',
+            'name': item.get('employer', item.get('school', '')),
+            'position': item.get('position', item.get('degree', '')),
+            'location': item.get('location', ''),
+            'start_date': item.get('start_timestamp', ''),
+            'end_date': item.get('end_timestamp', '')
+        } for item in data if isinstance(item, dict)]
+    
+    @_log_parse_errors('new photos', list)
+    def _parse_new_photos(self, json_file: Path, base_path: Path, data: Any = None) -> List[Dict[str, Any]]:
         """Parse photos from the new Facebook export format"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            photos = []
-            
-            # Handle uncategorized photos
-            if 'other_photos_v2' in data:
-                for photo_data in data['other_photos_v2']:
-                    photo_info = {
-                        'title': 'Uncategorized Photo',
-                        'description': '',
-                        'creation_timestamp': self._parse_timestamp(photo_data.get('creation_timestamp')),
-                        'uri': photo_data.get('uri', ''),
-                        'media_metadata': photo_data.get('media_metadata', {}),
-                        'comments': [],
-                        'reactions': [],
-                        'local_path': self._find_photo_file(photo_data.get('uri', ''), base_path)
-                    }
-                    photos.append(photo_info)
-            
-            # Handle album photos
-            if 'photos' in data:
-                album_name = data.get('name', 'Unknown Album')
-                for photo_data in data['photos']:
-                    photo_info = {
-                        'title': photo_data.get('title', album_name),
-                        'description': photo_data.get('description', ''),
-                        'creation_timestamp': self._parse_timestamp(photo_data.get('creation_timestamp')),
-                        'uri': photo_data.get('uri', ''),
-                        'media_metadata': photo_data.get('media_metadata', {}),
-                        'comments': [],
-                        'reactions': [],
-                        'local_path': self._find_photo_file(photo_data.get('uri', ''), base_path)
-                    }
-                    photos.append(photo_info)
+        uncategorized_photos = []
+        album_photos = []
+        album_name = 'Unknown Album'
+        untitled_photos = []
+        
+        # One pass over the file; the album name may come after its photos
+        sections = ('other_photos_v2.item', 'name', 'photos.item')
+        for section, photo_data in self._iter_json_sections(json_file, sections, data):
+            if section == 'name':
+                album_name = photo_data
+                continue
             
-            return photos
+            photo_info = {
+                'title': 'Uncategorized Photo',
+                'description': '',
+                'creation_timestamp': self._parse_timestamp(photo_data.get('creation_timestamp')),
+                'uri': photo_data.get('uri', ''),
+                'media_metadata': photo_data.get('media_metadata', {}),
+                'comments': [],
+                'reactions': [],
+                'local_path': self._find_photo_file(photo_data.get('uri', ''), base_path)
+            }
             
-        except Exception as e:
-            self.logger.error(f"Error parsing new photos from {json_file}: {str(e)}")
-            return []
+            if section == 'other_photos_v2.item':
+                # Handle uncategorized photos
+                uncategorized_photos.append(photo_info)
+            else:
+                # Handle album photos, titled after the album unless they have their own title
+                photo_info['description'] = photo_data.get('description', '')
+                if 'title' in photo_data:
+                    photo_info['title'] = photo_data['title']
+                else:
+                    untitled_photos.append(photo_info)
+                album_photos.append(photo_info)
+        
+        for photo_info in untitled_photos:
+            photo_info['title'] = album_name
+        
+        return uncategorized_photos + album_photos
     
-    def _parse_new_posts(self, json_file: Path) -> List[Dict[str, Any]]:
+    @_log_parse_errors('new posts', list)
+    def _parse_new_posts(self, json_file: Path, data: Any = None) -> List[Dict[str, Any]]:
         """Parse posts from the new Facebook export format"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            posts = []
-            
-            if isinstance(data, list):
-                for post_data in data:
-                    if isinstance(post_data, dict):
-                        post_info = {
-                            'timestamp': self._parse_timestamp(post_data.get('timestamp')),
-                            'title': post_data.get('title', ''),
-                            'data': post_data.get('data', []),
-                            'attachments': post_data.get('attachments', [])
-                        }
-                        posts.append(post_info)
-            
-            return posts
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing new posts from {json_file}: {str(e)}")
-            return []
+        posts = []
+        
+        for post_data in self._iter_json_items(json_file, 'item', data):
+            if isinstance(post_data, dict):
+                post_info = {
+                    'timestamp': self._parse_timestamp(post_data.get('timestamp')),
+                    'title': post_data.get('title', ''),
+                    'data': post_data.get('data', []),
+                    'attachments': post_data.get('attachments', [])
+                }
+                posts.append(post_info)
+        
+        return posts
     
-    def _parse_new_interests(self, json_file: Path) -> List[Dict[str, Any]]:
+    @_log_parse_errors('new interests', list)
+    def _parse_new_interests(self, json_file: Path, data: Any = None) -> List[Dict[str, Any]]:
         """Parse interests from the new Facebook export format"""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            interests = []
-            
-            # Parse liked pages
-            if 'page_likes_v2' in data:
-                for like_data in data['page_likes_v2']:
-                    name = like_data.get('name', '')
-                    # Fix common encoding issues
-                    name = name.replace('Ã½', 'ý').replace('Ã¡', 'á').replace('Ã©', 'é').replace('Ã­', 'í').replace('Ã³', 'ó').replace('Ãº', 'ú')
-                    
-                    interest_info = {
-                        'name': name,
-                        'category': 'Page',  # Default category for new format
-                        'timestamp': self._parse_timestamp(like_data.get('timestamp')),
-                        'url': like_data.get('url', '')
-                    }
-                    interests.append(interest_info)
-            
-            return interests
+        interests = []
+        
+        # Parse liked pages
+        likes = list(self._iter_json_items(json_file, 'page_likes_v2.item', data))
+        timestamps = self._parse_timestamps_bulk([like_data.get('timestamp') for like_data in likes])
+        
+        for like_data, timestamp in zip(likes, timestamps):
+            name = like_data.get('name', '')
+            # Fix common encoding issues
+            name = self._fix_encoding(name)
             
-        except Exception as e:
-            self.logger.error(f"Error parsing new interests from {json_file}: {str(e)}")
-            return []
+            interest_info = {
+                'name': name,
+                'category': 'Page',  # Default category for new format
+                'timestamp': timestamp,
+                'url': like_data.get('url', '')
+            }
+            interests.append(interest_info)
+        
+        return interests
     
-    def _parse_comments_for_profile(self, json_file: Path) -> List[Dict[str, Any]]:
-        """Parse comments to extract personality insights"""
+    def _fix_encoding(self, text: str) -> str:
+        """Undo the UTF-8-read-as-Latin-1 mojibake found in Facebook exports"""
+        if not text or text.isascii():
+            return text
+        
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # This could be used for personality analysis in the future
-            # For now, just return empty list
-            return []
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing comments from {json_file}: {str(e)}")
-            return []
+            return text.encode('latin-1').decode('utf-8')
+        except UnicodeError:
+            # Mixed or already-correct text; only patch the common sequences
+            for broken, fixed in (('Ã½', 'ý'), ('Ã¡', 'á'), ('Ã©', 'é'), ('Ã\xad', 'í'), ('Ã³', 'ó'), ('Ãº', 'ú')):
+                text = text.replace(broken, fixed)
+            return text
+    
+    @_log_parse_errors('comments', list)
+    def _parse_comments_for_profile(self, json_file: Path, data: Any = None) -> List[Dict[str, Any]]:
+        """Parse comments to extract personality insights"""
+        if data is None:
+            data = self._load_json(json_file)
+        
+        # This could be used for personality analysis in the future
+        # For now, just return empty list
+        return []
     
     def extract_dating_profile_data(self, facebook_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -620,10 +954,10 @@ class FacebookDataParser:
                 title = post.get('title', '')
                 if 'shared' in title or 'posted' in title:
                     # Extract name from "Name shared a link" or similar
-                    parts = title.split(' ')
+                    parts = title.split(' ', 2)
                     if len(parts) >= 2:
                         potential_name = ' '.join(parts[:2])  # Take first two words as name
-                        if potential_name and not any(word in potential_name.lower() for word in ['shared', 'posted', 'updated']):
+                        if potential_name and not _ACTIVITY_WORD_RE.search(potential_name):
                             name = potential_name
                             break
         
@@ -633,31 +967,32 @@ class FacebookDataParser:
             try:
                 birth_date = datetime.fromisoformat(profile_info['birthday'].replace('Z', '+00:00'))
                 age = (datetime.now() - birth_date).days // 365
-            except:
+            except (AttributeError, TypeError, ValueError):
                 pass
         
-        # Extract current job
+        # Extract current job and education in one pass
         current_job = None
-        for work in work_education:
-            if work.get('type') == 'work' and not work.get('end_date'):
-                current_job = f"{work.get('position', '')} at {work.get('name', '')}".strip()
-                break
-        
-        # Extract education
         education = None
-        for edu in work_education:
-            if edu.get('type') == 'education':
-                education = f"{edu.get('position', '')} from {edu.get('name', '')}".strip()
+        for entry in work_education:
+            entry_type = entry.get('type')
+            if current_job is None and entry_type == 'work' and not entry.get('end_date'):
+                current_job = f"{entry.get('position', '')} at {entry.get('name', '')}".strip()
+            elif education is None and entry_type == 'education':
+                education = f"{entry.get('position', '')} from {entry.get('name', '')}".strip()
+            
+            if current_job is not None and education is not None:
                 break
         
         # Extract top interests
-        top_interests = [interest.get('name', '') for interest in interests[:15] if interest.get('name')]
-        
-        # Filter photos with local paths (available for analysis)
-        available_photos = [photo for photo in photos if photo.get('local_path') and Path(photo['local_path']).exists()]
+        top_interests = [interest_name for interest in islice(interests, 15)
+                         if (interest_name := interest.get('name'))]
         
-        # Sort photos by creation timestamp (newest first)
-        available_photos.sort(key=lambda x: x.get('creation_timestamp', ''), reverse=True)
+        # Keep photos with local paths (available for analysis) and sort them by
+        # creation timestamp, newest first; photos without one go last
+        decorated = [(photo.get('creation_timestamp') or '', photo) for photo in photos
+                     if photo.get('local_path') and os.path.isfile(photo['local_path'])]
+        decorated.sort(key=itemgetter(0), reverse=True)
+        available_photos = [photo for _, photo in decorated]
         
         # Generate a basic bio from available data
         bio_parts = []
@@ -1 +1,28 @@
-# GUI package
\ No newline at end of file
+# GUI package
+
+import importlib
+
+# Widgets are resolved on first attribute access so that importing the
+# package does not pull in every tab (and PIL) up front
+_lazy_imports = {
+    'MainWindow': '.main_window',
+    'PhotoSelector': '.photo_selector',
+    'ProfileGenerator': '.profile_generator',
+    'ModelLoader': '.model_loader',
+    'FacebookImport': '.facebook_import',
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -5,24 +5,49 @@ Handles Facebook data export import and processing
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Mapping, Callable
 import json
+import time
 from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..data.facebook_parser import FacebookDataParser
 
+# Minimum seconds between progress bar updates sent from the import thread
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# File dialog filters
+FACEBOOK_EXPORT_FILE_TYPES = (
+    ("Facebook Export", "*.zip *.json"),
+    ("ZIP files", "*.zip"),
+    ("JSON files", "*.json"),
+    ("All files", "*.*")
+)
+PROCESSED_DATA_FILE_TYPES = (("JSON files", "*.json"), ("All files", "*.*"))
+
 class FacebookImport:
-    def __init__(self, parent, model_manager, logger):
+    def __init__(self, parent, model_manager, logger, executor=None,
+                 on_use_data: Optional[Callable[[], None]] = None):
         self.parent = parent
         self.model_manager = model_manager
         self.logger = logger
+        # Called when the user chooses to use the imported data for their profile
+        self.on_use_data = on_use_data
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="import")
         self.facebook_parser = FacebookDataParser()
         
         # Data storage
         self.facebook_data = {}
         self.dating_profile_data = {}
+        self._last_progress_update = 0.0
         
         self.setup_ui()
         
@@ -143,16 +168,9 @@ How to get your Facebook data:
     
     def browse_facebook_file(self):
         """Browse for Facebook data export file"""
-        file_types = [
-            ("Facebook Export", "*.zip *.json"),
-            ("ZIP files", "*.zip"),
-            ("JSON files", "*.json"),
-            ("All files", "*.*")
-        ]
-        
         file_path = filedialog.askopenfilename(
             title="Select Facebook Data Export",
-            filetypes=file_types
+            filetypes=FACEBOOK_EXPORT_FILE_TYPES
         )
         
         if file_path:
@@ -172,111 +190,134 @@ How to get your Facebook data:
             messagebox.showerror("Error", "Selected file does not exist!")
             return
         
+        self.import_btn.config(state='disabled')
+        self.import_status.set("Processing Facebook data...")
+        self.progress_var.set(10)
+        self._last_progress_update = 0.0
+        
         def import_thread():
             try:
-                self.import_btn.config(state='disabled')
-                self.import_status.set("Processing Facebook data...")
-                self.progress_var.set(10)
-                
-                # Parse Facebook data
-                self.facebook_data = self.facebook_parser.parse_facebook_export(file_path)
-                self.progress_var.set(50)
+                # Parse Facebook data, moving the bar from 10% to 50% as the JSON is parsed
+                facebook_data = self.facebook_parser.parse_facebook_export(
+                    file_path,
+                    progress_callback=lambda fraction: self.schedule_progress(10 + 40 * fraction)
+                )
+                self.schedule_progress(50)
                 
                 # Extract dating profile data
-                self.dating_profile_data = self.facebook_parser.extract_dating_profile_data(self.facebook_data)
-                self.progress_var.set(80)
+                dating_profile_data = self.facebook_parser.extract_dating_profile_data(facebook_data)
+                self.schedule_progress(80)
                 
-                # Update UI
-                self.parent.after(0, self.display_import_results)
-                self.progress_var.set(100)
-                self.import_status.set("Import completed successfully!")
+                # Build the result texts here so the Tk thread only has to insert them
+                results_text = self.format_import_results(facebook_data, dating_profile_data)
+                self.parent.after(0, self.on_import_complete, facebook_data, dating_profile_data, results_text)
                 
                 self.logger.info("Facebook data import completed successfully")
                 
             except Exception as e:
                 self.logger.error(f"Error importing Facebook data: {str(e)}")
-                self.parent.after(0, lambda: self.on_import_error(str(e)))
-            finally:
-                self.import_btn.config(state='normal')
+                self.parent.after(0, self.on_import_error, str(e))
         
-        threading.Thread(target=import_thread, daemon=True).start()
+        self.executor.submit(import_thread)
     
-    def display_import_results(self):
-        """Display the imported Facebook data"""
-        if not self.dating_profile_data:
+    def schedule_progress(self, progress: float):
+        """Hand a progress value from the import thread to the Tk thread, at most 20 times a second"""
+        now = time.monotonic()
+        if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
             return
         
-        # Display profile information
-        profile_info = []
-        profile_info.append("=== PROFILE INFORMATION ===\n")
-        profile_info.append(f"Name: {self.dating_profile_data.get('name', 'Not found')}")
-        profile_info.append(f"Age: {self.dating_profile_data.get('age', 'Not found')}")
-        profile_info.append(f"Location: {self.dating_profile_data.get('location', 'Not found')}")
-        profile_info.append(f"Hometown: {self.dating_profile_data.get('hometown', 'Not found')}")
-        profile_info.append(f"Occupation: {self.dating_profile_data.get('occupation', 'Not found')}")
-        profile_info.append(f"Education: {self.dating_profile_data.get('education', 'Not found')}")
-        profile_info.append(f"Relationship Status: {self.dating_profile_data.get('relationship_status', 'Not found')}")
-        
-        # Add statistics about data found
-        profile_info.append(f"\n=== DATA STATISTICS ===")
-        profile_info.append(f"Posts analyzed: {self.dating_profile_data.get('posts_analyzed', 0)}")
-        profile_info.append(f"Interests found: {self.dating_profile_data.get('interests_found', 0)}")
-        
-        if self.dating_profile_data.get('bio'):
-            profile_info.append(f"\nBio: {self.dating_profile_data['bio']}")
-        
-        # Add note about Facebook export limitations
-        profile_info.append(f"\n=== NOTE ===")
-        profile_info.append("Facebook exports may not include all profile information.")
-        profile_info.append("The app extracts what's available from your export file.")
-        profile_info.append("You can manually add missing information in the Profile Info tab.")
-        
-        self.profile_text.delete(1.0, tk.END)
-        self.profile_text.insert(1.0, "\n".join(profile_info))
-        
-        # Display photos information
-        photos_info = []
-        photos_info.append("=== PHOTOS INFORMATION ===\n")
-        photos_info.append(f"Total photos found: {self.dating_profile_data.get('total_photos_found', 0)}")
-        photos_info.append(f"Photos available for analysis: {self.dating_profile_data.get('available_photos_count', 0)}")
-        
-        photos = self.dating_profile_data.get('photos', [])
+        self._last_progress_update = now
+        self.parent.after(0, self.progress_var.set, progress)
+    
+    def on_import_complete(self, facebook_data: Dict[str, Any], dating_profile_data: Dict[str, Any],
+                           results_text: Tuple[str, str, str]):
+        """Called on the Tk thread once the import thread has finished"""
+        self.facebook_data = facebook_data
+        self.dating_profile_data = dating_profile_data
+        self.display_import_results(*results_text)
+        
+        self.progress_var.set(100)
+        self.import_status.set("Import completed successfully!")
+        self.import_btn.config(state='normal')
+    
+    def format_import_results(self, facebook_data: Dict[str, Any],
+                              dating_profile_data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Build the profile, photos and interests texts for the results tabs"""
+        get = dating_profile_data.get
+        
+        # Profile information, with statistics about the data found
+        bio = get('bio')
+        bio_text = f"\n\nBio: {bio}" if bio else ""
+        profile_text = (
+            "=== PROFILE INFORMATION ===\n\n"
+            f"Name: {get('name', 'Not found')}\n"
+            f"Age: {get('age', 'Not found')}\n"
+            f"Location: {get('location', 'Not found')}\n"
+            f"Hometown: {get('hometown', 'Not found')}\n"
+            f"Occupation: {get('occupation', 'Not found')}\n"
+            f"Education: {get('education', 'Not found')}\n"
+            f"Relationship Status: {get('relationship_status', 'Not found')}\n"
+            "\n=== DATA STATISTICS ===\n"
+            f"Posts analyzed: {get('posts_analyzed', 0)}\n"
+            f"Interests found: {get('interests_found', 0)}"
+            f"{bio_text}\n"
+            # Note about Facebook export limitations
+            "\n=== NOTE ===\n"
+            "Facebook exports may not include all profile information.\n"
+            "The app extracts what's available from your export file.\n"
+            "You can manually add missing information in the Profile Info tab."
+        )
+        
+        # Photos information
+        photos_info = [
+            "=== PHOTOS INFORMATION ===\n\n"
+            f"Total photos found: {get('total_photos_found', 0)}\n"
+            f"Photos available for analysis: {get('available_photos_count', 0)}"
+        ]
+        
+        photos = get('photos', [])
         if photos:
             photos_info.append("\nAvailable Photos:")
-            for i, photo in enumerate(photos[:10], 1):  # Show first 10
-                photos_info.append(f"{i}. {photo.get('title', 'Untitled')}")
-                if photo.get('description'):
-                    photos_info.append(f"   Description: {photo['description']}")
-                photos_info.append(f"   Path: {photo.get('local_path', 'Not available')}")
-                photos_info.append("")
+            for i, photo in enumerate(islice(photos, 10), 1):  # Show first 10
+                # One block per photo, ending in a blank line once joined
+                description = photo.get('description')
+                description_line = f"   Description: {description}\n" if description else ""
+                photos_info.append(f"{i}. {photo.get('title', 'Untitled')}\n{description_line}"
+                                   f"   Path: {photo.get('local_path', 'Not available')}\n")
             
             if len(photos) > 10:
                 photos_info.append(f"... and {len(photos) - 10} more photos")
         
-        self.photos_text.delete(1.0, tk.END)
-        self.photos_text.insert(1.0, "\n".join(photos_info))
-        
-        # Display interests
-        interests_info = []
-        interests_info.append("=== INTERESTS & LIKES ===\n")
-        
-        interests = self.dating_profile_data.get('interests', '')
+        # Interests
+        interests = get('interests', '')
         if interests:
-            interests_info.append("Extracted interests:")
-            interests_info.append(interests)
+            interests_info = [f"=== INTERESTS & LIKES ===\n\nExtracted interests:\n{interests}"]
         else:
-            interests_info.append("No interests found in the data")
+            interests_info = ["=== INTERESTS & LIKES ===\n\nNo interests found in the data"]
         
         # Show raw interests data if available
-        if self.facebook_data.get('interests'):
+        raw_interests = facebook_data.get('interests')
+        if raw_interests:
             interests_info.append("\n\nAll liked pages/interests:")
-            for interest in self.facebook_data['interests'][:20]:  # Show first 20
+            for interest in islice(raw_interests, 20):  # Show first 20
                 interests_info.append(f"• {interest.get('name', 'Unknown')}")
                 if interest.get('category'):
                     interests_info.append(f"  Category: {interest['category']}")
         
-        self.interests_text.delete(1.0, tk.END)
-        self.interests_text.insert(1.0, "\n".join(interests_info))
+        return profile_text, "\n".join(photos_info), "\n".join(interests_info)
+    
+    def display_import_results(self, profile_text: str, photos_text: str, interests_text: str):
+        """Display the imported Facebook data"""
+        if not self.dating_profile_data:
+            return
+        
+        # Each tab is replaced with one delete and one insert; Tk redraws them
+        # together once the Tk thread is idle again
+        for text_widget, text in ((self.profile_text, profile_text),
+                                  (self.photos_text, photos_text),
+                                  (self.interests_text, interests_text)):
+            text_widget.delete(1.0, tk.END)
+            text_widget.insert(1.0, text)
         
         # Enable action buttons
         self.use_data_btn.config(state='normal')
@@ -286,6 +327,7 @@ How to get your Facebook data:
         """Handle import errors"""
         self.import_status.set("Import failed")
         self.progress_var.set(0)
+        self.import_btn.config(state='normal')
         messagebox.showerror("Import Error", f"Failed to import Facebook data:\n\n{error_message}")
     
     def use_facebook_data(self):
@@ -295,10 +337,8 @@ How to get your Facebook data:
             return
         
         try:
-            # Get the main window instance and call integration method
-            main_window = self.parent.master.master  # Navigate up to MainWindow
-            if hasattr(main_window, 'integrate_facebook_data'):
-                main_window.integrate_facebook_data()
+            if self.on_use_data is not None:
+                self.on_use_data()
             else:
                 # Fallback message
                 messagebox.showinfo(
@@ -325,25 +365,31 @@ How to get your Facebook data:
             file_path = filedialog.asksaveasfilename(
                 title="Export Processed Facebook Data",
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=PROCESSED_DATA_FILE_TYPES
             )
             
             if file_path:
                 # Prepare export data
+                facebook_data = self.facebook_data
                 export_data = {
                     'dating_profile_data': self.dating_profile_data,
                     'raw_facebook_data': {
-                        'profile_info': self.facebook_data.get('profile_info', {}),
-                        'photos_count': len(self.facebook_data.get('photos', [])),
-                        'interests_count': len(self.facebook_data.get('interests', [])),
-                        'posts_count': len(self.facebook_data.get('posts', [])),
-                        'friends_count': len(self.facebook_data.get('friends', []))
+                        'profile_info': facebook_data.get('profile_info', {}),
+                        'photos_count': len(facebook_data.get('photos') or ()),
+                        'interests_count': len(facebook_data.get('interests') or ()),
+                        'posts_count': len(facebook_data.get('posts') or ()),
+                        'friends_count': len(facebook_data.get('friends') or ())
                     },
                     'export_timestamp': datetime.now().isoformat()
                 }
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    data = orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                    with open(file_path, 'wb') as f:
+                        f.write(data)
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(export_data, f, indent=2, ensure_ascii=False)
                 
                 messagebox.showinfo("Success", f"Data exported successfully to:\n{file_path}")
                 self.logger.info(f"Facebook data exported to: {file_path}")
@@ -352,9 +398,10 @@ How to get your Facebook data:
             self.logger.error(f"Error exporting data: {str(e)}")
             messagebox.showerror("Error", f"Error exporting data: {str(e)}")
     
-    def get_dating_profile_data(self) -> Dict[str, Any]:
-        """Get the processed dating profile data"""
-        return self.dating_profile_data.copy() if self.dating_profile_data else {}
+    def get_dating_profile_data(self) -> Mapping[str, Any]:
+        """Get a read-only view of the processed dating profile data"""
+        # A new import replaces the dict rather than changing it, so the view stays consistent
+        return MappingProxyType(self.dating_profile_data)
     
     def get_facebook_photos(self) -> list:
         """Get the list of available Facebook photos"""
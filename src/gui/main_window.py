@@ -4,10 +4,14 @@ Main GUI window for the Dating Profile Optimizer
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import heapq
 import logging
+import os
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from operator import itemgetter
 import json
 from PIL import Image, ImageTk
 
@@ -15,18 +19,32 @@ from .photo_selector import PhotoSelector
 from .profile_generator import ProfileGenerator
 from .model_loader import ModelLoader
 from .facebook_import import FacebookImport
+from ..utils.thumbnails import load_thumbnail as load_cached_thumbnail
+
+# Size of one top-photo tile on the results canvas: a 100px thumbnail plus its score
+THUMBNAIL_TILE_WIDTH = 110
+THUMBNAIL_TILE_HEIGHT = 130
+
+# Log records shown in the GUI are batched and written this often
+LOG_FLUSH_INTERVAL_MS = 100
 
 class MainWindow:
-    def __init__(self, root, model_manager, logger):
+    def __init__(self, root, model_manager, logger, executor=None):
         self.root = root
         self.model_manager = model_manager
         self.logger = logger
+        # Model work is serialized on one persistent worker shared by all tabs
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="infer")
+        # File imports and image decoding run on a small bounded pool of their own
+        self.io_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="io")
         
         # Data storage
         self.uploaded_photos = []
         self.analyzed_photos = []
         self.user_info = {}
         self.generated_profile = ""
+        # (analyzed photos list, its length, top 5 photos) from the last selection
+        self._top_photos_cache = None
         
         self.setup_ui()
         
@@ -89,7 +107,7 @@ First, load the AI models (this may take a few minutes):"""
         model_frame = ttk.LabelFrame(main_frame, text="AI Models", padding=20)
         model_frame.pack(fill='x', pady=(0, 20))
         
-        self.model_loader = ModelLoader(model_frame, self.model_manager, self.logger)
+        self.model_loader = ModelLoader(model_frame, self.model_manager, self.logger, self.executor)
         
         # Log viewer
         log_frame = ttk.LabelFrame(main_frame, text="Application Logs", padding=10)
@@ -103,11 +121,13 @@ First, load the AI models (this may take a few minutes):"""
     
     def setup_facebook_tab(self):
         """Setup the Facebook import tab"""
-        self.facebook_import = FacebookImport(self.facebook_tab, self.model_manager, self.logger)
+        self.facebook_import = FacebookImport(self.facebook_tab, self.model_manager, self.logger, self.io_executor,
+                                              on_use_data=self.integrate_facebook_data)
     
     def setup_photos_tab(self):
         """Setup the photo selection tab"""
-        self.photo_selector = PhotoSelector(self.photos_tab, self.model_manager, self.logger)
+        self.photo_selector = PhotoSelector(self.photos_tab, self.model_manager, self.logger, self.executor,
+                                            self.io_executor)
         
     def setup_profile_tab(self):
         """Setup the profile information tab"""
@@ -135,8 +155,10 @@ First, load the AI models (this may take a few minutes):"""
         photos_frame = ttk.LabelFrame(results_frame, text="Selected Photos (Top 5)", padding=10)
         photos_frame.pack(fill='x', pady=(0, 20))
         
-        self.photos_display_frame = ttk.Frame(photos_frame)
-        self.photos_display_frame.pack(fill='x')
+        # One canvas holds every thumbnail tile, so redisplaying creates no widgets
+        self.photos_canvas = tk.Canvas(photos_frame, height=THUMBNAIL_TILE_HEIGHT, highlightthickness=0)
+        self.photos_canvas.pack(fill='x')
+        self._thumbnail_refs = []
         
         # Generated profile frame
         profile_frame = ttk.LabelFrame(results_frame, text="Generated Profile Description", padding=10)
@@ -155,15 +177,29 @@ First, load the AI models (this may take a few minutes):"""
             def __init__(self, text_widget):
                 super().__init__()
                 self.text_widget = text_widget
+                self.pending = deque()
+                self.write_scheduled = False
                 
             def emit(self, record):
-                msg = self.format(record)
-                def append():
-                    self.text_widget.config(state='normal')
-                    self.text_widget.insert(tk.END, msg + '\n')
-                    self.text_widget.config(state='disabled')
-                    self.text_widget.see(tk.END)
-                self.text_widget.after(0, append)
+                # Buffer the record; the first one in a batch schedules the write
+                self.pending.append(self.format(record))
+                if not self.write_scheduled:
+                    self.write_scheduled = True
+                    self.text_widget.after(LOG_FLUSH_INTERVAL_MS, self.write_pending)
+            
+            def write_pending(self):
+                # Clear the flag first so records emitted while draining schedule another write
+                self.write_scheduled = False
+                messages = []
+                while self.pending:
+                    messages.append(self.pending.popleft())
+                if not messages:
+                    return
+                
+                self.text_widget.config(state='normal')
+                self.text_widget.insert(tk.END, '\n'.join(messages) + '\n')
+                self.text_widget.config(state='disabled')
+                self.text_widget.see(tk.END)
         
         gui_handler = GUILogHandler(self.log_text)
         gui_handler.setLevel(logging.INFO)
@@ -216,9 +252,9 @@ First, load the AI models (this may take a few minutes):"""
                 photos = self.photo_selector.get_analyzed_photos()
                 user_info = self.profile_generator.get_user_info()
                 
-                # If no manual data, try to use Facebook data
+                # If no manual data, try to use Facebook data (as a plain dict for the model code)
                 if not user_info and self.facebook_import.has_data():
-                    user_info = self.facebook_import.get_dating_profile_data()
+                    user_info = dict(self.facebook_import.get_dating_profile_data())
                 
                 if not photos:
                     messagebox.showerror("Error", "Please upload and analyze photos first!")
@@ -229,14 +265,19 @@ First, load the AI models (this may take a few minutes):"""
                     return
                 
                 # Select top 5 photos
-                top_photos = sorted(photos, key=lambda x: x['attractiveness_score'], reverse=True)[:5]
+                top_photos = self.get_top_photos(photos)
+                
+                # Decode the thumbnails while the description is being generated
+                thumbnail_futures = [self.io_executor.submit(self.load_thumbnail, photo['image_path'])
+                                     for photo in top_photos]
                 
                 # Generate profile description
                 image_descriptions = [photo['caption'] for photo in top_photos]
                 profile_description = self.model_manager.generate_profile_description(user_info, image_descriptions)
+                thumbnails = [future.result() for future in thumbnail_futures]
                 
                 # Update UI
-                self.root.after(0, lambda: self.display_results(top_photos, profile_description))
+                self.root.after(0, lambda: self.display_results(top_photos, profile_description, thumbnails))
                 self.status_var.set("Results generated successfully!")
                 
             except Exception as e:
@@ -244,32 +285,52 @@ First, load the AI models (this may take a few minutes):"""
                 messagebox.showerror("Error", f"Error generating results: {str(e)}")
                 self.status_var.set("Error generating results")
         
-        threading.Thread(target=generate, daemon=True).start()
+        self.executor.submit(generate)
     
-    def display_results(self, top_photos: List[Dict], profile_description: str):
+    def get_top_photos(self, photos: List[Dict]) -> List[Dict]:
+        """Return the 5 best-scoring photos, reused while the analyzed photos are unchanged"""
+        # Analysis replaces the list and only ever appends to it, so the list
+        # object and its length identify its contents
+        cached = self._top_photos_cache
+        if cached is None or cached[0] is not photos or cached[1] != len(photos):
+            top_photos = heapq.nlargest(5, photos, key=itemgetter('attractiveness_score'))
+            cached = self._top_photos_cache = (photos, len(photos), top_photos)
+        
+        return cached[2]
+    
+    def load_thumbnail(self, image_path: str) -> Optional[Image.Image]:
+        """Decode a photo into a 100x100 thumbnail; safe to call from worker threads"""
+        try:
+            return load_cached_thumbnail(image_path, (100, 100))
+        except Exception as e:
+            self.logger.error(f"Error displaying photo {image_path}: {str(e)}")
+            return None
+    
+    def display_results(self, top_photos: List[Dict], profile_description: str,
+                        thumbnails: Optional[List[Optional[Image.Image]]] = None):
         """Display the final results"""
         # Clear previous results
-        for widget in self.photos_display_frame.winfo_children():
-            widget.destroy()
+        self.photos_canvas.delete('all')
+        self._thumbnail_refs = []
+        
+        if thumbnails is None:
+            thumbnails = [self.load_thumbnail(photo['image_path']) for photo in top_photos]
         
-        # Display top photos
-        for i, photo in enumerate(top_photos):
-            photo_frame = ttk.Frame(self.photos_display_frame)
-            photo_frame.pack(side=tk.LEFT, padx=5)
+        # Display top photos as tiles: thumbnail with its score underneath
+        tile_x = THUMBNAIL_TILE_WIDTH // 2
+        for photo, img in zip(top_photos, thumbnails):
+            if img is None:
+                continue
             
-            # Load and display thumbnail
+            # Tk images must be created on the Tk thread
             try:
-                img = Image.open(photo['image_path'])
-                img.thumbnail((100, 100))
                 photo_img = ImageTk.PhotoImage(img)
+                self._thumbnail_refs.append(photo_img)  # Keep reference
                 
-                photo_label = ttk.Label(photo_frame, image=photo_img)
-                photo_label.image = photo_img  # Keep reference
-                photo_label.pack()
-                
-                # Score label
-                score_label = ttk.Label(photo_frame, text=f"Score: {photo['attractiveness_score']:.2f}")
-                score_label.pack()
+                self.photos_canvas.create_image(tile_x, 0, image=photo_img, anchor='n')
+                self.photos_canvas.create_text(tile_x, 105, text=f"Score: {photo['attractiveness_score']:.2f}",
+                                               anchor='n')
+                tile_x += THUMBNAIL_TILE_WIDTH
                 
             except Exception as e:
                 self.logger.error(f"Error displaying photo {photo['image_path']}: {str(e)}")
@@ -299,7 +360,7 @@ First, load the AI models (this may take a few minutes):"""
             # Export photo recommendations
             photos = self.photo_selector.get_analyzed_photos()
             if photos:
-                top_photos = sorted(photos, key=lambda x: x['attractiveness_score'], reverse=True)[:5]
+                top_photos = self.get_top_photos(photos)
                 
                 recommendations = {
                     "recommended_photos": [
@@ -4,13 +4,14 @@ Model loading interface
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+from concurrent.futures import ThreadPoolExecutor
 
 class ModelLoader:
-    def __init__(self, parent, model_manager, logger):
+    def __init__(self, parent, model_manager, logger, executor=None):
         self.parent = parent
         self.model_manager = model_manager
         self.logger = logger
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="infer")
         
         self.setup_ui()
         
@@ -58,29 +59,29 @@ Note: First-time loading will download models (~2-3 GB total)"""
     
     def load_models(self):
         """Load all AI models"""
+        # Widgets are only touched on the Tk thread; the worker reports back via after()
+        self.load_button.config(state='disabled')
+        self.status_label.config(text="Loading models...")
+        
         def load_thread():
             try:
-                self.load_button.config(state='disabled')
-                self.status_label.config(text="Loading models...")
-                
                 def progress_callback(message, progress):
-                    self.parent.after(0, lambda: self.update_progress(message, progress))
+                    self.parent.after(0, self.update_progress, message, progress)
                 
                 self.model_manager.load_models(progress_callback)
                 
-                self.parent.after(0, lambda: self.on_models_loaded())
+                self.parent.after(0, self.on_models_loaded)
                 
             except Exception as e:
                 self.logger.error(f"Error loading models: {str(e)}")
-                self.parent.after(0, lambda: self.on_models_error(str(e)))
+                self.parent.after(0, self.on_models_error, str(e))
         
-        threading.Thread(target=load_thread, daemon=True).start()
+        self.executor.submit(load_thread)
     
     def update_progress(self, message, progress):
-        """Update progress display"""
+        """Update progress display (the bound variables trigger the redraw)"""
         self.progress_text.set(message)
         self.progress_var.set(progress)
-        self.parent.update_idletasks()
     
     def on_models_loaded(self):
         """Called when models are successfully loaded"""
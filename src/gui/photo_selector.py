@@ -4,19 +4,47 @@ Photo selection and analysis interface
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageTk
+import json
+import os
+import time
+from PIL import ImageTk
 from typing import List, Dict
 
+from ..utils.analysis_cache import AnalysisCache
+from ..utils.thumbnails import load_thumbnail
+
+# Threads hashing photos for their cache keys ahead of the model
+HASH_WORKERS = 4
+
+# Threads checking that Facebook photos exist on disk
+PATH_CHECK_WORKERS = 8
+
+# Height of one result row (150px thumbnail, rank and padding)
+RESULT_ROW_HEIGHT = 210
+
+# Result rows kept alive and recycled while scrolling; enough to fill a tall window
+RESULT_ROW_POOL_SIZE = 12
+
+# Threads decoding result thumbnails when no shared IO executor is given
+THUMBNAIL_WORKERS = 4
+
+# Minimum seconds between analysis progress updates handed to Tk (~30 per second)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
 class PhotoSelector:
-    def __init__(self, parent, model_manager, logger):
+    def __init__(self, parent, model_manager, logger, executor=None, io_executor=None):
         self.parent = parent
         self.model_manager = model_manager
         self.logger = logger
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="infer")
+        self.io_executor = io_executor or ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumb")
         
         self.uploaded_photos = []
         self.analyzed_photos = []
+        self.analysis_cache = AnalysisCache()
+        self._last_progress_update = 0.0
         
         self.setup_ui()
         
@@ -77,23 +105,20 @@ class PhotoSelector:
         results_frame = ttk.LabelFrame(main_frame, text="Analysis Results", padding=10)
         results_frame.pack(fill='both', expand=True)
         
-        # Create scrollable frame for photos
-        canvas = tk.Canvas(results_frame)
-        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Rows are placed directly on the canvas and recycled while scrolling
+        self.results_canvas = tk.Canvas(results_frame, highlightthickness=0)
+        self.results_scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=self.results_canvas.yview)
         
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.results_canvas.configure(yscrollcommand=self.on_results_scroll)
+        self.results_canvas.bind("<Configure>", self.on_results_resize)
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.results_canvas.pack(side="left", fill="both", expand=True)
+        self.results_scrollbar.pack(side="right", fill="y")
         
-        self.results_display = self.scrollable_frame
+        self.results_display = self.results_canvas
+        self.result_rows = []
+        self.sorted_results = []
+        self.thumbnail_placeholder = None
     
     def upload_photos(self):
         """Upload photos for analysis"""
@@ -134,34 +159,82 @@ class PhotoSelector:
         def analyze_thread():
             try:
                 self.analyzed_photos = []
+                self._last_progress_update = 0.0
                 total_photos = len(self.uploaded_photos)
+                model_version = self.get_model_version()
                 
-                for i, photo_path in enumerate(self.uploaded_photos):
-                    # Update progress
-                    progress = (i / total_photos) * 100
-                    self.parent.after(0, lambda p=progress: self.update_progress(p))
-                    self.parent.after(0, lambda: self.analysis_status.set(f"Analyzing photo {i+1}/{total_photos}"))
+                # Hashing reads every photo in full; do it on a few threads so it
+                # overlaps with the model working on earlier photos
+                with ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash") as hash_pool:
+                    cache_keys = hash_pool.map(
+                        lambda photo_path: self.analysis_cache.get_key(photo_path, model_version),
+                        self.uploaded_photos
+                    )
                     
-                    # Analyze photo
-                    analysis_result = self.model_manager.analyze_image(photo_path)
-                    self.analyzed_photos.append(analysis_result)
+                    for i, (photo_path, cache_key) in enumerate(zip(self.uploaded_photos, cache_keys)):
+                        # Update progress (cached photos finish faster than Tk can redraw)
+                        self.schedule_analysis_progress(i, total_photos)
+                        
+                        # Reuse a previous result for identical photo contents
+                        analysis_result = self.analysis_cache.load(cache_key)
+                        
+                        if analysis_result is not None:
+                            analysis_result['image_path'] = photo_path
+                        else:
+                            # Analyze photo
+                            analysis_result = self.model_manager.analyze_image(photo_path)
+                            
+                            # Failed analyses are retried on the next run
+                            if analysis_result.get('caption') != 'Error analyzing image':
+                                self.analysis_cache.store(cache_key, analysis_result)
+                        
+                        self.analyzed_photos.append(analysis_result)
                 
                 # Update UI
-                self.parent.after(0, lambda: self.update_progress(100))
-                self.parent.after(0, lambda: self.analysis_status.set(f"Analysis complete - {len(self.analyzed_photos)} photos analyzed"))
-                self.parent.after(0, self.display_results)
+                self.parent.after(0, self.on_analysis_complete)
                 
             except Exception as e:
                 self.logger.error(f"Error analyzing photos: {str(e)}")
-                self.parent.after(0, lambda: messagebox.showerror("Error", f"Error analyzing photos: {str(e)}"))
-                self.parent.after(0, lambda: self.analysis_status.set("Analysis failed"))
+                self.parent.after(0, self.on_analysis_error, str(e))
         
-        threading.Thread(target=analyze_thread, daemon=True).start()
+        self.executor.submit(analyze_thread)
+    
+    def get_model_version(self) -> str:
+        """Identify the configured models so cached results change with them"""
+        model_configs = getattr(self.model_manager, 'model_configs', {})
+        return json.dumps(
+            {key: config.get('name', '') for key, config in model_configs.items()},
+            sort_keys=True
+        )
     
     def update_progress(self, progress):
-        """Update progress bar"""
+        """Update progress bar (the bound variable triggers the redraw)"""
         self.progress_var.set(progress)
-        self.parent.update_idletasks()
+    
+    def schedule_analysis_progress(self, index, total):
+        """Hand analysis progress from the worker thread to the Tk thread, at most 30 times a second"""
+        now = time.monotonic()
+        if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        
+        self._last_progress_update = now
+        self.parent.after(0, self.show_analysis_progress, index, total)
+    
+    def show_analysis_progress(self, index, total):
+        """Update progress bar and status for the photo being analyzed"""
+        self.update_progress((index / total) * 100)
+        self.analysis_status.set(f"Analyzing photo {index + 1}/{total}")
+    
+    def on_analysis_complete(self):
+        """Called on the Tk thread when all photos have been analyzed"""
+        self.update_progress(100)
+        self.analysis_status.set(f"Analysis complete - {len(self.analyzed_photos)} photos analyzed")
+        self.display_results()
+    
+    def on_analysis_error(self, error_message):
+        """Called on the Tk thread when photo analysis fails"""
+        messagebox.showerror("Error", f"Error analyzing photos: {error_message}")
+        self.analysis_status.set("Analysis failed")
     
     def display_results(self):
         """Display analysis results"""
@@ -171,73 +244,178 @@ class PhotoSelector:
             return
         
         # Sort by attractiveness score
-        sorted_photos = sorted(self.analyzed_photos, key=lambda x: x['attractiveness_score'], reverse=True)
+        self.sorted_results = sorted(self.analyzed_photos, key=lambda x: x['attractiveness_score'], reverse=True)
         
-        for i, photo_data in enumerate(sorted_photos):
-            self.create_photo_result_widget(photo_data, i + 1)
+        # Only a screenful of rows exists; they are refilled as the list scrolls
+        for _ in range(min(RESULT_ROW_POOL_SIZE, len(self.sorted_results))):
+            self.result_rows.append(self.create_result_row())
+        
+        self.results_canvas.configure(
+            scrollregion=(0, 0, 0, len(self.sorted_results) * RESULT_ROW_HEIGHT)
+        )
+        self.results_canvas.yview_moveto(0)
+        self.refresh_visible_rows()
     
-    def create_photo_result_widget(self, photo_data, rank):
-        """Create widget to display photo analysis result"""
-        # Main frame for this photo
+    def create_result_row(self) -> Dict:
+        """Create the widgets of one recyclable result row"""
+        # Main frame for this row
         photo_frame = ttk.Frame(self.results_display)
-        photo_frame.pack(fill='x', pady=10, padx=10)
         
         # Left side - thumbnail
         left_frame = ttk.Frame(photo_frame)
-        left_frame.pack(side=tk.LEFT, padx=(0, 20))
+        left_frame.pack(side=tk.LEFT, padx=(10, 20), pady=10)
         
-        try:
-            # Load and display thumbnail
-            img = Image.open(photo_data['image_path'])
-            img.thumbnail((150, 150))
-            photo_img = ImageTk.PhotoImage(img)
-            
-            photo_label = ttk.Label(left_frame, image=photo_img)
-            photo_label.image = photo_img  # Keep reference
-            photo_label.pack()
-            
-            # Rank label
-            rank_label = ttk.Label(left_frame, text=f"Rank #{rank}", font=('Arial', 10, 'bold'))
-            rank_label.pack(pady=(5, 0))
-            
-        except Exception as e:
-            self.logger.error(f"Error loading thumbnail for {photo_data['image_path']}: {str(e)}")
-            error_label = ttk.Label(left_frame, text="Error loading image")
-            error_label.pack()
+        photo_label = ttk.Label(left_frame)
+        photo_label.pack()
+        
+        # Rank label
+        rank_label = ttk.Label(left_frame, font=('Arial', 10, 'bold'))
+        rank_label.pack(pady=(5, 0))
+        
+        # Right side - analysis details, one read-only text widget styled with tags
+        # (some themes leave the frame background unset, so fall back to the canvas colour)
+        background = ttk.Style().lookup('TFrame', 'background') or self.results_canvas.cget('background')
+        details_text = tk.Text(
+            photo_frame, wrap='word', height=8, font=('Arial', 10), cursor='arrow',
+            borderwidth=0, highlightthickness=0, background=background
+        )
+        details_text.tag_configure('bold', font=('Arial', 10, 'bold'))
+        details_text.tag_configure('field', spacing1=5)
+        for score_color in ('green', 'orange', 'red'):
+            details_text.tag_configure(score_color, foreground=score_color)
+        details_text.configure(state='disabled')
+        details_text.pack(side=tk.LEFT, fill='both', expand=True, pady=10)
+        
+        # Separator
+        separator = ttk.Separator(photo_frame, orient='horizontal')
+        separator.place(relx=0, rely=1.0, relwidth=1.0, anchor='sw')
+        
+        window_id = self.results_canvas.create_window(
+            (0, 0), window=photo_frame, anchor="nw",
+            width=self.results_canvas.winfo_width(), height=RESULT_ROW_HEIGHT
+        )
+        
+        return {
+            'window': window_id,
+            'index': None,
+            'photo': None,
+            'image_path': None,
+            'thumbnail_requested': False,
+            'photo_label': photo_label,
+            'rank_label': rank_label,
+            'details_text': details_text
+        }
+    
+    def show_result_row(self, row: Dict, photo_data: Dict, rank: int):
+        """Fill a recycled row with one photo's analysis result"""
+        # Drop the previous photo's bitmap; the thumbnail is only decoded once the row is on screen
+        row['photo'] = None
+        row['image_path'] = photo_data['image_path']
+        row['thumbnail_requested'] = False
+        row['photo_label'].configure(image=self.get_thumbnail_placeholder(), text='')
         
-        # Right side - analysis details
-        right_frame = ttk.Frame(photo_frame)
-        right_frame.pack(side=tk.LEFT, fill='x', expand=True)
+        row['rank_label'].configure(text=f"Rank #{rank}")
+        
+        details_text = row['details_text']
+        details_text.configure(state='normal')
+        details_text.delete('1.0', tk.END)
         
         # File name
         file_name = Path(photo_data['image_path']).name
-        name_label = ttk.Label(right_frame, text=f"File: {file_name}", font=('Arial', 10, 'bold'))
-        name_label.pack(anchor='w')
+        details_text.insert(tk.END, f"File: {file_name}\n", ('bold',))
         
         # Attractiveness score
         score = photo_data['attractiveness_score']
         score_color = 'green' if score > 0.7 else 'orange' if score > 0.5 else 'red'
-        score_label = ttk.Label(right_frame, text=f"Attractiveness Score: {score:.2f}", foreground=score_color)
-        score_label.pack(anchor='w', pady=(5, 0))
+        details_text.insert(tk.END, f"Attractiveness Score: {score:.2f}\n", ('field', score_color))
         
         # Caption
-        caption_label = ttk.Label(right_frame, text=f"AI Description: {photo_data['caption']}", wraplength=400)
-        caption_label.pack(anchor='w', pady=(5, 0))
+        details_text.insert(tk.END, f"AI Description: {photo_data['caption']}\n", ('field',))
         
         # Sentiment
         sentiment = photo_data['sentiment']
-        sentiment_text = f"Sentiment: {sentiment['label']} ({sentiment['score']:.2f})"
-        sentiment_label = ttk.Label(right_frame, text=sentiment_text)
-        sentiment_label.pack(anchor='w', pady=(5, 0))
+        details_text.insert(tk.END, f"Sentiment: {sentiment['label']} ({sentiment['score']:.2f})", ('field',))
+        details_text.configure(state='disabled')
+    
+    def get_thumbnail_placeholder(self):
+        """Gray square shown in a row until its thumbnail is decoded"""
+        if self.thumbnail_placeholder is None:
+            self.thumbnail_placeholder = tk.PhotoImage(width=150, height=150)
+            self.thumbnail_placeholder.put('gray85', to=(0, 0, 150, 150))
+        return self.thumbnail_placeholder
+    
+    def request_row_thumbnail(self, row: Dict):
+        """Decode a visible row's thumbnail off the Tk thread"""
+        row['thumbnail_requested'] = True
+        index, image_path = row['index'], row['image_path']
+        
+        future = self.io_executor.submit(load_thumbnail, image_path, (150, 150))
+        future.add_done_callback(
+            lambda f: self.parent.after(0, self.on_thumbnail_loaded, row, index, image_path, f)
+        )
+    
+    def on_thumbnail_loaded(self, row: Dict, index: int, image_path: str, future):
+        """Called on the Tk thread when a row's thumbnail has been decoded"""
+        # The row was recycled for another result or cleared in the meantime
+        if row['index'] != index:
+            return
         
-        # Separator
-        separator = ttk.Separator(self.results_display, orient='horizontal')
-        separator.pack(fill='x', pady=10)
+        try:
+            # Decoded once per unchanged photo by the shared thumbnail cache
+            row['photo'] = ImageTk.PhotoImage(future.result())  # Keep reference
+            row['photo_label'].configure(image=row['photo'], text='')
+        
+        except Exception as e:
+            self.logger.error(f"Error loading thumbnail for {image_path}: {str(e)}")
+            row['photo_label'].configure(image='', text="Error loading image")
+    
+    def refresh_visible_rows(self):
+        """Move the row pool to the visible part of the results and refill rows that changed"""
+        if not self.result_rows:
+            return
+        
+        first = int(self.results_canvas.canvasy(0) // RESULT_ROW_HEIGHT)
+        first = max(0, min(first, len(self.sorted_results) - len(self.result_rows)))
+        
+        for index in range(first, first + len(self.result_rows)):
+            # Each row owns every pool-size-th result, so a one-row scroll refills one row
+            row = self.result_rows[index % len(self.result_rows)]
+            if row['index'] == index:
+                continue
+            
+            self.show_result_row(row, self.sorted_results[index], index + 1)
+            self.results_canvas.coords(row['window'], 0, index * RESULT_ROW_HEIGHT)
+            row['index'] = index
+        
+        # Rows of the pool below the fold keep their placeholder until scrolled into view
+        top = self.results_canvas.canvasy(0)
+        bottom = self.results_canvas.canvasy(self.results_canvas.winfo_height())
+        for row in self.result_rows:
+            row_top = row['index'] * RESULT_ROW_HEIGHT
+            if not row['thumbnail_requested'] and row_top < bottom and row_top + RESULT_ROW_HEIGHT > top:
+                self.request_row_thumbnail(row)
+    
+    def on_results_scroll(self, first, last):
+        """Keep the scrollbar in sync and recycle rows whenever the view moves"""
+        self.results_scrollbar.set(first, last)
+        self.refresh_visible_rows()
+    
+    def on_results_resize(self, event):
+        """Stretch the rows to the canvas width"""
+        for row in self.result_rows:
+            self.results_canvas.itemconfigure(row['window'], width=event.width)
     
     def clear_results_display(self):
         """Clear the results display"""
         for widget in self.results_display.winfo_children():
             widget.destroy()
+        self.results_display.delete('all')
+        
+        # Thumbnails still decoding must not touch the destroyed rows
+        for row in self.result_rows:
+            row['index'] = None
+        self.result_rows = []
+        self.sorted_results = []
     
     def get_analyzed_photos(self) -> List[Dict]:
         """Get the analyzed photos data"""
@@ -245,26 +423,38 @@ class PhotoSelector:
     
     def load_facebook_photos(self, facebook_photos: List[Dict]):
         """Load photos from Facebook data"""
-        try:
-            # Filter photos that have local paths
-            available_photos = [
-                photo['local_path'] for photo in facebook_photos 
-                if photo.get('local_path') and Path(photo['local_path']).exists()
-            ]
-            
-            if available_photos:
-                self.uploaded_photos = available_photos
-                self.upload_status.set(f"{len(available_photos)} Facebook photos loaded")
-                self.analysis_status.set("Facebook photos loaded - ready for analysis")
-                self.logger.info(f"Loaded {len(available_photos)} Facebook photos")
+        # Filter photos that have local paths
+        local_paths = [photo['local_path'] for photo in facebook_photos if photo.get('local_path')]
+        
+        def check_thread():
+            try:
+                # The stat calls overlap on a few threads, off the Tk thread
+                with ThreadPoolExecutor(max_workers=PATH_CHECK_WORKERS, thread_name_prefix="stat") as stat_pool:
+                    available_photos = [
+                        path for path, exists in zip(local_paths, stat_pool.map(os.path.isfile, local_paths))
+                        if exists
+                    ]
                 
-                # Clear previous analysis
-                self.analyzed_photos = []
-                self.clear_results_display()
-            else:
-                self.upload_status.set("No accessible Facebook photos found")
-                self.logger.warning("No accessible Facebook photos found")
+                self.parent.after(0, self.on_facebook_photos_checked, available_photos)
                 
-        except Exception as e:
-            self.logger.error(f"Error loading Facebook photos: {str(e)}")
-            self.upload_status.set("Error loading Facebook photos")
\ No newline at end of file
+            except Exception as e:
+                self.logger.error(f"Error loading Facebook photos: {str(e)}")
+                self.parent.after(0, self.upload_status.set, "Error loading Facebook photos")
+        
+        self.upload_status.set("Checking Facebook photos...")
+        self.io_executor.submit(check_thread)
+    
+    def on_facebook_photos_checked(self, available_photos: List[str]):
+        """Take over the Facebook photos found on disk"""
+        if available_photos:
+            self.uploaded_photos = available_photos
+            self.upload_status.set(f"{len(available_photos)} Facebook photos loaded")
+            self.analysis_status.set("Facebook photos loaded - ready for analysis")
+            self.logger.info(f"Loaded {len(available_photos)} Facebook photos")
+            
+            # Clear previous analysis
+            self.analyzed_photos = []
+            self.clear_results_display()
+        else:
+            self.upload_status.set("No accessible Facebook photos found")
+            self.logger.warning("No accessible Facebook photos found")
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Disk cache for photo analysis results, keyed by photo content
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "dating-profile-optimizer" / "scores"
+
+class AnalysisCache:
+    def __init__(self, cache_dir=None):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        # Digests of photos already hashed, by (path, mtime, size, model version)
+        self._key_memo = {}
+    
+    def get_key(self, image_path: str, model_version: str = "") -> Optional[str]:
+        """
+        Build a cache key from the photo bytes and the model version
+        
+        Args:
+            image_path: Path to the photo
+            model_version: Identifier of the models producing the results
+            
+        Returns:
+            Hex digest, or None if the photo could not be read
+        """
+        try:
+            # An unchanged photo is not read again on the next analysis
+            stat = os.stat(image_path)
+            memo_key = (image_path, stat.st_mtime_ns, stat.st_size, model_version)
+            key = self._key_memo.get(memo_key)
+            if key is not None:
+                return key
+            
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(model_version.encode('utf-8'))
+            with open(image_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError as e:
+            self.logger.warning(f"Could not hash {image_path}: {str(e)}")
+            return None
+        
+        key = digest.hexdigest()
+        self._key_memo[memo_key] = key
+        return key
+    
+    def load(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis result for a key, if any"""
+        if not key:
+            return None
+        
+        try:
+            if orjson is not None:
+                with open(self.cache_dir / f"{key}.json", 'rb') as f:
+                    return orjson.loads(f.read())
+            
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {key}: {str(e)}")
+            return None
+    
+    def store(self, key: Optional[str], result: Dict[str, Any]):
+        """Write an analysis result to the cache"""
+        if not key:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                data = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+                with open(self.cache_dir / f"{key}.json", 'wb') as f:
+                    f.write(data)
+                return
+            
+            with open(self.cache_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not cache analysis result {key}: {str(e)}")
\ No newline at end of file
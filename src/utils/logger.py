@@ -2,14 +2,25 @@
 Logging configuration for the Dating Profile Optimizer
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from pathlib import Path
 
+# Background listeners writing the queued records and their log file handlers, by logger name
+_listeners = {}
+
+# Records buffered before the log file is written, unless an error arrives first
+FILE_BUFFER_CAPACITY = 512
+
+# The log file is rotated at this size, keeping this many old files
+LOG_FILE_MAX_BYTES = 5_000_000
+LOG_FILE_BACKUP_COUNT = 5
+
 def setup_logger(name="dating_profile_optimizer", level=logging.INFO):
     """Setup comprehensive logging system"""
-    
     # Create logs directory
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
@@ -20,6 +31,7 @@ def setup_logger(name="dating_profile_optimizer", level=logging.INFO):
     
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -30,23 +42,55 @@ def setup_logger(name="dating_profile_optimizer", level=logging.INFO):
         '%(asctime)s - %(levelname)s - %(message)s'
     )
     
-    # File handler for detailed logs
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_handler = logging.FileHandler(
-        logs_dir / f"app_{timestamp}.log",
-        encoding='utf-8'
+    # File handler for detailed logs (file is opened on the first emitted record)
+    file_handler = logging.handlers.RotatingFileHandler(
+        logs_dir / "app.log",
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
     
+    # Write and flush the file in batches; errors and shutdown flush immediately
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+    
     # Console handler for important messages
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; a listener thread does the file and console IO
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    _listeners[name] = (listener, file_handler)
     
     logger.info("Logger initialized successfully")
-    return logger
\ No newline at end of file
+    return logger
+
+def _stop_listener(name):
+    """Flush and stop the listener thread of a logger, if one is running"""
+    entry = _listeners.pop(name, None)
+    if entry is not None:
+        listener, file_handler = entry
+        listener.stop()
+        # Closing writes out the buffered file records before the handlers are dropped
+        for handler in listener.handlers:
+            handler.close()
+        # The memory handler leaves its target open, so close the log file as well
+        file_handler.close()
+
+@atexit.register
+def _stop_all_listeners():
+    """Write out records still queued when the application exits"""
+    for name in list(_listeners):
+        _stop_listener(name)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+In-memory cache of decoded photo thumbnails
+"""
+
+import functools
+import os
+from typing import Tuple
+
+from PIL import Image
+
+# About 65 KB per 150x150 RGB thumbnail
+THUMBNAIL_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=THUMBNAIL_CACHE_SIZE)
+def _decode_thumbnail(image_path: str, mtime_ns: int, file_size: int, size: Tuple[int, int]) -> Image.Image:
+    """Decode a thumbnail; mtime and file size are part of the key so edited photos are re-read"""
+    with Image.open(image_path) as img:
+        # Let libjpeg decode straight to RGB at 1/2-1/8 scale, at least twice the thumbnail size
+        img.draft('RGB', (size[0] * 2, size[1] * 2))
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        # Closing destroys the image core, so hand out a copy of the small thumbnail
+        return img.copy()
+
+
+def load_thumbnail(image_path: str, size: Tuple[int, int]) -> Image.Image:
+    """
+    Return a thumbnail of a photo, decoding the file only once while it is unchanged
+    
+    Args:
+        image_path: Path to the photo
+        size: Maximum (width, height) of the thumbnail
+    
+    Returns:
+        PIL image shared with other callers; it must not be modified
+    """
+    stat = os.stat(image_path)
+    return _decode_thumbnail(image_path, stat.st_mtime_ns, stat.st_size, tuple(size))
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Unit tests for the photo analysis cache
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.analysis_cache import AnalysisCache
+
+
+class TestAnalysisCache(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = AnalysisCache(Path(self.test_dir) / "scores")
+        
+        self.photo_path = Path(self.test_dir) / "photo.jpg"
+        self.photo_path.write_bytes(b"fake image data")
+        
+        self.sample_result = {
+            'image_path': str(self.photo_path),
+            'caption': 'A person smiling',
+            'sentiment': {'label': 'POSITIVE', 'score': 0.8},
+            'attractiveness_score': 0.75
+        }
+        
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_store_and_load(self):
+        """Test that a stored result is returned for the same key"""
+        key = self.cache.get_key(str(self.photo_path), "v1")
+        
+        self.assertIsNone(self.cache.load(key))
+        
+        self.cache.store(key, self.sample_result)
+        
+        self.assertEqual(self.cache.load(key), self.sample_result)
+    
+    def test_key_depends_on_content(self):
+        """Test that identical contents share a key and changed contents do not"""
+        copy_path = Path(self.test_dir) / "copy.jpg"
+        copy_path.write_bytes(b"fake image data")
+        
+        original_key = self.cache.get_key(str(self.photo_path))
+        self.assertEqual(original_key, self.cache.get_key(str(copy_path)))
+        
+        copy_path.write_bytes(b"edited image data")
+        self.assertNotEqual(original_key, self.cache.get_key(str(copy_path)))
+    
+    def test_unchanged_photo_is_hashed_once(self):
+        """Test that the key of an unchanged photo is reused without reading it again"""
+        key = self.cache.get_key(str(self.photo_path), "v1")
+        
+        with patch('builtins.open', side_effect=AssertionError("photo read again")):
+            self.assertEqual(self.cache.get_key(str(self.photo_path), "v1"), key)
+    
+    def test_key_depends_on_model_version(self):
+        """Test that changing models invalidates cached results"""
+        key_v1 = self.cache.get_key(str(self.photo_path), "v1")
+        key_v2 = self.cache.get_key(str(self.photo_path), "v2")
+        
+        self.assertNotEqual(key_v1, key_v2)
+    
+    def test_missing_photo(self):
+        """Test that unreadable photos are never cached"""
+        key = self.cache.get_key(str(Path(self.test_dir) / "missing.jpg"))
+        
+        self.assertIsNone(key)
+        self.assertIsNone(self.cache.load(key))
+        self.cache.store(key, self.sample_result)
+        self.assertFalse((Path(self.test_dir) / "scores").exists())
+    
+    def test_corrupt_entry(self):
+        """Test that a corrupt cache file is treated as a miss"""
+        key = self.cache.get_key(str(self.photo_path))
+        cache_dir = Path(self.test_dir) / "scores"
+        cache_dir.mkdir()
+        (cache_dir / f"{key}.json").write_text("{not json")
+        
+        self.assertIsNone(self.cache.load(key))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -3,9 +3,11 @@ Unit tests for Facebook data parser
 """
 
 import unittest
+import os
 import tempfile
 import shutil
 import json
+import time
 import zipfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -14,7 +16,7 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from data.facebook_parser import FacebookDataParser
+from data.facebook_parser import FacebookDataParser, _read_json
 
 
 class TestFacebookDataParser(unittest.TestCase):
@@ -112,6 +114,19 @@ class TestFacebookDataParser(unittest.TestCase):
         self.assertEqual(result['website'], 'https://johndoe.com')
         self.assertEqual(result['email'], 'john@example.com')
     
+    def test_parse_profile_info_null_fields(self):
+        """Test that null profile sections do not discard the whole profile"""
+        profile_data = {"profile_v2": {"name": {"full_name": "John Doe"}, "bio": None, "gender": None}}
+        test_file = Path(self.test_dir) / "profile_information.json"
+        with open(test_file, 'w') as f:
+            json.dump(profile_data, f)
+        
+        result = self.parser._parse_profile_info(test_file)
+        
+        self.assertEqual(result['name'], "John Doe")
+        self.assertEqual(result['bio'], "")
+        self.assertEqual(result['gender'], "")
+    
     def test_parse_new_photos(self):
         """Test parsing photos data in new format"""
         # Create test JSON file
@@ -151,6 +166,90 @@ class TestFacebookDataParser(unittest.TestCase):
         self.assertEqual(result[1]['name'], 'Hiking Club')
         self.assertEqual(result[1]['category'], 'Sports')
     
+    def test_parse_timestamps_bulk(self):
+        """Test bulk timestamp parsing matches single conversions"""
+        timestamps = [1609459200, None, 1640995200, 0, 1672531200]
+        expected = [self.parser._parse_timestamp(ts) for ts in timestamps]
+        
+        self.assertEqual(self.parser._parse_timestamps_bulk(timestamps), expected)
+        self.assertEqual(self.parser._parse_timestamps_bulk([]), [])
+    
+    @unittest.skipUnless(hasattr(time, 'tzset'), "time zone cannot be changed on this platform")
+    def test_parse_timestamps_bulk_historical_offset(self):
+        """Test bulk timestamp parsing in a zone whose UTC offset changed in the past"""
+        try:
+            import numpy  # noqa: F401 - the bulk path only runs once NumPy is loaded
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        
+        # Moscow was UTC+4 all year from 2011 to 2014 and UTC+3 before and after
+        with patch.dict(os.environ, {'TZ': 'Europe/Moscow'}):
+            time.tzset()
+            try:
+                timestamps = [1200000000, 1340000000, 1600000000]
+                expected = [self.parser._parse_timestamp(ts) for ts in timestamps]
+                
+                self.assertEqual(expected[1], '2012-06-18T10:13:20')
+                self.assertEqual(self.parser._parse_timestamps_bulk(timestamps), expected)
+            finally:
+                time.tzset()
+    
+    def test_fix_encoding(self):
+        """Test repairing mojibake in exported names"""
+        self.assertEqual(self.parser._fix_encoding("KvÃ½tek"), "Kvýtek")
+        self.assertEqual(self.parser._fix_encoding("Å\x99eka"), "řeka")
+        self.assertEqual(self.parser._fix_encoding("Café"), "Café")
+        self.assertEqual(self.parser._fix_encoding("Hiking"), "Hiking")
+    
+    def test_parse_export_file_loads_shared_file_once(self):
+        """Test that a file parsed as both posts and photos is only read once"""
+        test_file = Path(self.test_dir) / "album" / "your_posts__check_ins__photos_and_videos_1.json"
+        test_file.parent.mkdir()
+        with open(test_file, 'w') as f:
+            json.dump({"name": "Summer", "photos": [{"uri": "photos/a.jpg"}]}, f)
+        
+        with patch('data.facebook_parser._read_json', wraps=_read_json) as mock_read:
+            results = self.parser._parse_export_file(('posts', 'photos'), str(test_file), Path(self.test_dir))
+            mock_read.assert_called_once()
+        
+        self.assertEqual([key for key, _ in results], ['posts', 'photos'])
+        self.assertEqual(results[1][1][0]['title'], 'Summer')
+    
+    def test_parse_errors_return_empty_result(self):
+        """Test that unreadable files are logged and yield empty results"""
+        missing_file = Path(self.test_dir) / "missing.json"
+        
+        self.assertEqual(self.parser._parse_profile_info(missing_file), {})
+        self.assertEqual(self.parser._parse_new_interests(missing_file), [])
+    
+    def test_iter_json_items_prefix(self):
+        """Test iterating the values under a JSON prefix"""
+        test_file = Path(self.test_dir) / "album.json"
+        with open(test_file, 'w') as f:
+            json.dump({"name": "Summer", "photos": [{"uri": "a.jpg"}, {"uri": "b.jpg"}]}, f)
+        
+        photos = list(self.parser._iter_json_items(test_file, 'photos.item'))
+        self.assertEqual([photo['uri'] for photo in photos], ["a.jpg", "b.jpg"])
+        self.assertEqual(list(self.parser._iter_json_items(test_file, 'name')), ["Summer"])
+        self.assertEqual(list(self.parser._iter_json_items(test_file, 'friends_v2.item')), [])
+    
+    def test_parse_new_photos_streams_file_once(self):
+        """Test that a streamed album is read in one pass, even with its name after the photos"""
+        test_file = Path(self.test_dir) / "album.json"
+        with open(test_file, 'w') as f:
+            json.dump({"photos": [{"uri": "a.jpg", "title": "Own title"}, {"uri": "b.jpg"}], "name": "Summer"}, f)
+        
+        import data.facebook_parser as facebook_parser
+        if facebook_parser.ijson is None:
+            self.skipTest("ijson is not installed")
+        
+        with patch.object(facebook_parser, 'STREAMING_MIN_BYTES', 0), \
+             patch.object(facebook_parser.ijson, 'parse', wraps=facebook_parser.ijson.parse) as mock_parse:
+            photos = self.parser._parse_new_photos(test_file, Path(self.test_dir))
+            mock_parse.assert_called_once()
+        
+        self.assertEqual([photo['title'] for photo in photos], ["Own title", "Summer"])
+    
     def test_parse_birthday(self):
         """Test birthday parsing"""
         # Valid birthday
@@ -240,6 +339,18 @@ class TestFacebookDataParser(unittest.TestCase):
         self.assertEqual(result['total_photos_found'], 2)
         self.assertEqual(result['available_photos_count'], 2)
     
+    def test_extract_name_from_posts_with_interests(self):
+        """Test that the post-title name survives interest extraction"""
+        facebook_data = {
+            'posts': [{'title': 'Jane Roe shared a link.'}],
+            'interests': [{'name': 'Hiking'}, {'name': 'Music'}]
+        }
+        
+        result = self.parser.extract_dating_profile_data(facebook_data)
+        
+        self.assertEqual(result['name'], 'Jane Roe')
+        self.assertEqual(result['interests'], 'Hiking, Music')
+    
     def test_find_photo_file(self):
         """Test finding photo files"""
         # Create test photo file
@@ -260,6 +371,111 @@ class TestFacebookDataParser(unittest.TestCase):
         result = self.parser._find_photo_file("nonexistent.jpg", Path(self.test_dir))
         self.assertIsNone(result)
     
+    def test_find_photo_file_by_name_uses_index(self):
+        """Test that moved photos are found through the file name index"""
+        photo_dir = Path(self.test_dir) / "other" / "nested"
+        photo_dir.mkdir(parents=True)
+        photo_file = photo_dir / "moved.jpg"
+        photo_file.write_text("fake image data")
+        
+        result = self.parser._find_photo_file("old/dir/moved.jpg", Path(self.test_dir))
+        self.assertEqual(result, str(photo_file))
+        self.assertEqual(self.parser._file_index_root, str(Path(self.test_dir)))
+        
+        # Later lookups reuse the index instead of walking the tree again
+        with patch.object(self.parser, '_iter_files') as mock_iter:
+            result = self.parser._find_photo_file("other/moved.jpg", Path(self.test_dir))
+            mock_iter.assert_not_called()
+        self.assertEqual(result, str(photo_file))
+    
+    def test_find_photo_file_direct_hit_skips_index(self):
+        """Test that photos found at their URI do not walk the folder"""
+        photo_file = Path(self.test_dir) / "photos" / "test.jpg"
+        photo_file.parent.mkdir()
+        photo_file.write_text("fake image data")
+        
+        with patch.object(self.parser, '_iter_files') as mock_iter:
+            result = self.parser._find_photo_file("photos/test.jpg", Path(self.test_dir))
+            mock_iter.assert_not_called()
+        self.assertEqual(result, str(photo_file))
+    
+    def test_extract_zip(self):
+        """Test extracting a ZIP export with the threaded extractor"""
+        test_zip = Path(self.test_dir) / "export.zip"
+        with zipfile.ZipFile(test_zip, 'w') as zip_ref:
+            zip_ref.writestr("posts/album/0.json", json.dumps(self.sample_photos_data))
+            zip_ref.writestr("posts/media/photo.jpg", b"fake image data")
+            zip_ref.writestr("../outside.txt", "should stay inside")
+        
+        extract_dir = Path(self.test_dir) / "extracted"
+        with zipfile.ZipFile(test_zip) as zip_ref:
+            members = self.parser._zip_members(zip_ref, extract_dir)
+            self.parser._extract_members(zip_ref, [(info, target) for target, info in members.items()])
+        
+        self.assertEqual((extract_dir / "posts" / "media" / "photo.jpg").read_bytes(), b"fake image data")
+        self.assertTrue((extract_dir / "posts" / "album" / "0.json").exists())
+        self.assertTrue((extract_dir / "outside.txt").exists())
+        self.assertFalse((Path(self.test_dir) / "outside.txt").exists())
+    
+    def test_parse_zip_export_extracts_referenced_photos_only(self):
+        """Test that only JSON files and referenced photos are extracted"""
+        album = {"name": "Summer", "photos": [{"uri": "posts/media/photo.jpg", "creation_timestamp": 1609459200}]}
+        test_zip = Path(self.test_dir) / "export.zip"
+        with zipfile.ZipFile(test_zip, 'w') as zip_ref:
+            zip_ref.writestr("posts/album/0.json", json.dumps(album))
+            zip_ref.writestr("posts/media/photo.jpg", b"fake image data")
+            zip_ref.writestr("posts/media/video.mp4", b"fake video data")
+        
+        cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        try:
+            result = self.parser.parse_facebook_export(str(test_zip))
+            extract_dir = Path(result['extraction_path'])
+            
+            self.assertEqual(len(result['photos']), 1)
+            self.assertTrue(os.path.isfile(result['photos'][0]['local_path']))
+            self.assertFalse((extract_dir / "posts" / "media" / "video.mp4").exists())
+        finally:
+            os.chdir(cwd)
+    
+    def test_run_parse_tasks_small_export_stays_in_process(self):
+        """Test that small exports are parsed without a process pool"""
+        interests_file = Path(self.test_dir) / "pages_you've_liked.json"
+        with open(interests_file, 'w') as f:
+            json.dump({"page_likes_v2": [{"name": "Hiking", "timestamp": 1609459200}]}, f)
+        
+        tasks = [(('interests',), str(interests_file), Path(self.test_dir))]
+        
+        with patch('data.facebook_parser.ProcessPoolExecutor') as mock_pool:
+            results = self.parser._run_parse_tasks(tasks)
+            mock_pool.assert_not_called()
+        
+        self.assertEqual(len(results), 1)
+        key, interests = results[0]
+        self.assertEqual(key, 'interests')
+        self.assertEqual(interests[0]['name'], 'Hiking')
+    
+    def test_run_parse_tasks_reports_progress(self):
+        """Test that parse progress is reported by share of JSON bytes"""
+        small_file = Path(self.test_dir) / "pages_you've_liked.json"
+        with open(small_file, 'w') as f:
+            json.dump({"page_likes_v2": []}, f)
+        
+        large_file = Path(self.test_dir) / "your_uncategorized_photos.json"
+        with open(large_file, 'w') as f:
+            json.dump({"other_photos_v2": [], "padding": "x" * 1000}, f)
+        
+        tasks = [(('interests',), str(small_file), Path(self.test_dir)),
+                 (('photos',), str(large_file), Path(self.test_dir))]
+        progress = []
+        
+        results = self.parser._run_parse_tasks(tasks, progress.append)
+        
+        self.assertEqual([key for key, _ in results], ['interests', 'photos'])
+        self.assertEqual(len(progress), 2)
+        self.assertLess(progress[0], 0.1)
+        self.assertEqual(progress[1], 1.0)
+    
     def test_parse_facebook_export_file_not_found(self):
         """Test parsing non-existent file"""
         with self.assertRaises(FileNotFoundError):
@@ -273,42 +489,48 @@ class TestFacebookDataParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.parser.parse_facebook_export(str(test_file))
     
-    @patch('zipfile.ZipFile')
-    def test_parse_zip_export(self, mock_zipfile):
-        """Test parsing ZIP export"""
-        # Create test ZIP file
-        test_zip = Path(self.test_dir) / "facebook_export.zip"
-        test_zip.write_text("fake zip content")
-        
-        # Mock ZIP extraction
-        mock_zip_instance = MagicMock()
-        mock_zipfile.return_value.__enter__.return_value = mock_zip_instance
-        
-        # Create temporary directory structure
-        temp_dir = Path(self.test_dir) / "extracted"
-        temp_dir.mkdir()
-        
-        # Create test JSON files
-        profile_file = temp_dir / "profile_information.json"
-        with open(profile_file, 'w') as f:
-            json.dump(self.sample_profile_data, f)
-        
-        photos_file = temp_dir / "photos_and_videos.json"
-        with open(photos_file, 'w') as f:
-            json.dump(self.sample_photos_data, f)
+    def _write_export_zip(self, name, album_name):
+        """Write a small ZIP export with one album and its photo"""
+        album = {"name": album_name, "photos": [{"uri": "posts/media/photo.jpg", "creation_timestamp": 1609459200}]}
+        zip_path = Path(self.test_dir) / name
+        with zipfile.ZipFile(zip_path, 'w') as zip_ref:
+            zip_ref.writestr("posts/album/0.json", json.dumps(album))
+            zip_ref.writestr("posts/media/photo.jpg", b"fake image data")
+        return zip_path
+    
+    def test_parse_zip_export(self):
+        """Test that a re-imported ZIP reuses its extraction and a new export replaces it"""
+        test_zip = self._write_export_zip("facebook_export.zip", "Summer")
+        other_zip = self._write_export_zip("other_export.zip", "Winter")
         
-        with patch('tempfile.TemporaryDirectory') as mock_temp_dir:
-            mock_temp_dir.return_value.__enter__.return_value = str(temp_dir)
+        # The extraction root is relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        try:
+            result = self.parser._parse_zip_export(test_zip)
+            extract_dir = Path(result['extraction_path'])
+            complete_marker = Path(f"{extract_dir}.complete")
             
-            with patch.object(Path, 'rglob') as mock_rglob:
-                mock_rglob.return_value = [profile_file, photos_file]
-                
-                result = self.parser._parse_zip_export(test_zip)
-                
-                self.assertIsInstance(result, dict)
-                self.assertIn('profile_info', result)
-                self.assertIn('photos', result)
-
+            self.assertEqual(result['photos'][0]['title'], "Summer")
+            self.assertTrue(os.path.isfile(result['photos'][0]['local_path']))
+            self.assertTrue(complete_marker.exists())
+            
+            # A completed extraction of the same ZIP is reused without extracting again
+            with patch.object(self.parser, '_extract_members') as mock_extract:
+                reused = self.parser._parse_zip_export(test_zip)
+                mock_extract.assert_not_called()
+            self.assertEqual(reused['extraction_path'], result['extraction_path'])
+            self.assertEqual(reused['photos'][0]['local_path'], result['photos'][0]['local_path'])
+            
+            # Another export clears out the previous extraction
+            other = self.parser._parse_zip_export(other_zip)
+            self.assertNotEqual(other['extraction_path'], result['extraction_path'])
+            self.assertFalse(extract_dir.exists())
+            self.assertFalse(complete_marker.exists())
+            self.assertEqual(other['photos'][0]['title'], "Winter")
+            self.assertTrue(os.path.isfile(other['photos'][0]['local_path']))
+        finally:
+            os.chdir(cwd)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
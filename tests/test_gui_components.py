@@ -39,16 +39,15 @@ class TestModelLoader(unittest.TestCase):
         self.assertIsNotNone(loader.progress_bar)
         self.assertIsNotNone(loader.load_button)
     
-    @patch('threading.Thread')
-    def test_load_models(self, mock_thread):
+    def test_load_models(self):
         """Test load models method"""
-        loader = ModelLoader(self.parent, self.model_manager, self.logger)
+        mock_executor = MagicMock()
+        loader = ModelLoader(self.parent, self.model_manager, self.logger, mock_executor)
         
         loader.load_models()
         
-        # Verify thread was created and started
-        mock_thread.assert_called_once()
-        mock_thread.return_value.start.assert_called_once()
+        # Verify loading was submitted to the worker
+        mock_executor.submit.assert_called_once()
     
     def test_update_progress(self):
         """Test progress update"""
@@ -2,14 +2,16 @@
 Unit tests for logger utility
 """
 
+import os
 import unittest
 import tempfile
 import shutil
 import logging
+import logging.handlers
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.utils.logger import setup_logger
+from src.utils.logger import setup_logger, _stop_all_listeners
 
 
 class TestLogger(unittest.TestCase):
@@ -19,8 +21,14 @@ class TestLogger(unittest.TestCase):
         self.test_dir = tempfile.mkdtemp()
         self.original_cwd = Path.cwd()
         
+        # Buffered records are written on shutdown, so give them a real logs directory
+        (Path(self.test_dir) / "logs").mkdir()
+        os.chdir(self.test_dir)
+        
     def tearDown(self):
         """Clean up test environment"""
+        _stop_all_listeners()
+        os.chdir(self.original_cwd)
         shutil.rmtree(self.test_dir, ignore_errors=True)
         
     @patch('src.utils.logger.Path.cwd')
@@ -39,8 +47,9 @@ class TestLogger(unittest.TestCase):
             # Verify logs directory creation
             mock_mkdir.assert_called_once_with(exist_ok=True)
             
-            # Verify handlers
-            self.assertEqual(len(logger.handlers), 2)  # File and console handlers
+            # Verify handlers (file and console handlers run behind a queue)
+            self.assertEqual(len(logger.handlers), 1)
+            self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
     
     @patch('src.utils.logger.Path.cwd')
     def test_setup_logger_custom_name_level(self, mock_cwd):
@@ -59,7 +68,7 @@ class TestLogger(unittest.TestCase):
         mock_cwd.return_value = Path(self.test_dir)
         
         with patch('src.utils.logger.Path.mkdir'):
-            with patch('src.utils.logger.logging.FileHandler') as mock_file_handler:
+            with patch('src.utils.logger.logging.handlers.RotatingFileHandler') as mock_file_handler:
                 with patch('src.utils.logger.logging.StreamHandler') as mock_stream_handler:
                     mock_file_instance = MagicMock()
                     mock_stream_instance = MagicMock()
@@ -98,8 +107,9 @@ class TestLogger(unittest.TestCase):
             # Setup logger should clear existing handlers
             logger = setup_logger(name="test_clear")
             
-            # Should have exactly 2 handlers (file + console)
-            self.assertEqual(len(logger.handlers), 2)
+            # Should have exactly the queue handler feeding file + console
+            self.assertEqual(len(logger.handlers), 1)
+            self.assertNotIn(existing_handler, logger.handlers)
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@ class TestDatingProfileApp(unittest.TestCase):
     def setUp(self):
         """Set up test environment"""
         # Mock tkinter to avoid GUI creation during tests
-        self.tk_patcher = patch('main.tk.Tk')
+        self.tk_patcher = patch('tkinter.Tk')
         self.mock_tk = self.tk_patcher.start()
         self.mock_root = MagicMock()
         self.mock_tk.return_value = self.mock_root
@@ -29,8 +29,8 @@ class TestDatingProfileApp(unittest.TestCase):
         self.tk_patcher.stop()
     
     @patch('main.setup_logger')
-    @patch('main.ModelManager')
-    @patch('main.MainWindow')
+    @patch('src.models.model_manager.ModelManager')
+    @patch('src.gui.MainWindow')
     def test_init(self, mock_main_window, mock_model_manager, mock_setup_logger):
         """Test DatingProfileApp initialization"""
         mock_logger = MagicMock()
@@ -50,11 +50,18 @@ class TestDatingProfileApp(unittest.TestCase):
         mock_setup_logger.assert_called_once()
         mock_logger.info.assert_called_with("Starting Dating Profile Optimizer")
         
+        # Heavy components are deferred until the window has been shown
+        mock_model_manager.assert_not_called()
+        mock_main_window.assert_not_called()
+        self.mock_root.after.assert_called_once_with(50, app._init_heavy)
+        
+        app._init_heavy()
+        
         # Verify model manager creation
         mock_model_manager.assert_called_once()
         
         # Verify main window creation
-        mock_main_window.assert_called_once_with(self.mock_root, mock_manager, mock_logger)
+        mock_main_window.assert_called_once_with(self.mock_root, mock_manager, mock_logger, app.executor)
         
         # Verify attributes
         self.assertEqual(app.root, self.mock_root)
@@ -63,8 +70,8 @@ class TestDatingProfileApp(unittest.TestCase):
         self.assertEqual(app.main_window, mock_window)
     
     @patch('main.setup_logger')
-    @patch('main.ModelManager')
-    @patch('main.MainWindow')
+    @patch('src.models.model_manager.ModelManager')
+    @patch('src.gui.MainWindow')
     def test_run_success(self, mock_main_window, mock_model_manager, mock_setup_logger):
         """Test successful app run"""
         app = DatingProfileApp()
@@ -74,9 +81,9 @@ class TestDatingProfileApp(unittest.TestCase):
         self.mock_root.mainloop.assert_called_once()
     
     @patch('main.setup_logger')
-    @patch('main.ModelManager')
-    @patch('main.MainWindow')
-    @patch('main.messagebox.showerror')
+    @patch('src.models.model_manager.ModelManager')
+    @patch('src.gui.MainWindow')
+    @patch('tkinter.messagebox.showerror')
     def test_run_with_exception(self, mock_showerror, mock_main_window, mock_model_manager, mock_setup_logger):
         """Test app run with exception"""
         mock_logger = MagicMock()
@@ -91,6 +98,26 @@ class TestDatingProfileApp(unittest.TestCase):
         # Verify error handling
         mock_logger.error.assert_called_with("Application error: Test error")
         mock_showerror.assert_called_with("Error", "Application error: Test error")
+    
+    @patch('main.setup_logger')
+    @patch('src.models.model_manager.ModelManager')
+    @patch('src.gui.MainWindow')
+    @patch('tkinter.messagebox.showerror')
+    def test_init_heavy_with_exception(self, mock_showerror, mock_main_window, mock_model_manager, mock_setup_logger):
+        """Test deferred initialization failing after the window is shown"""
+        mock_logger = MagicMock()
+        mock_setup_logger.return_value = mock_logger
+        
+        # Make main window creation raise an exception
+        mock_main_window.side_effect = Exception("Test error")
+        
+        app = DatingProfileApp()
+        app._init_heavy()
+        
+        # Verify error handling closes the window
+        mock_logger.error.assert_called_with("Application error: Test error")
+        mock_showerror.assert_called_with("Error", "Application error: Test error")
+        self.mock_root.destroy.assert_called_once()
 
 
 if __name__ == '__main__':
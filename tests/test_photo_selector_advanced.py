@@ -117,19 +117,18 @@ class TestPhotoSelectorAdvanced(unittest.TestCase):
         mock_showerror.assert_called_once()
         self.assertIn("load AI models first", mock_showerror.call_args[0][1])
     
-    @patch('src.gui.photo_selector.threading.Thread')
-    def test_analyze_photos_success(self, mock_thread):
+    def test_analyze_photos_success(self):
         """Test successful photo analysis"""
         selector, mock_parent, mock_model_manager, mock_logger = self._create_photo_selector_with_mocks()
         
         mock_model_manager.models_loaded = True
         selector.uploaded_photos = self.test_images
+        selector.executor = MagicMock()
         
         selector.analyze_photos()
         
-        # Verify thread was created and started
-        mock_thread.assert_called_once()
-        mock_thread.return_value.start.assert_called_once()
+        # Verify analysis was submitted to the worker
+        selector.executor.submit.assert_called_once()
     
     def test_update_progress(self):
         """Test progress update functionality"""
@@ -137,9 +136,33 @@ class TestPhotoSelectorAdvanced(unittest.TestCase):
         
         selector.update_progress(75.0)
         
-        # Verify progress bar updated
+        # Verify progress bar updated without forcing a redraw
         selector.progress_var.set.assert_called_with(75.0)
-        mock_parent.update_idletasks.assert_called_once()
+        mock_parent.update_idletasks.assert_not_called()
+    
+    def test_show_analysis_progress(self):
+        """Test combined progress and status update for one photo"""
+        selector, mock_parent, mock_model_manager, mock_logger = self._create_photo_selector_with_mocks()
+        
+        selector.show_analysis_progress(1, 4)
+        
+        selector.progress_var.set.assert_called_with(25.0)
+        selector.analysis_status.set.assert_called_with("Analyzing photo 2/4")
+    
+    @patch('src.gui.photo_selector.time.monotonic')
+    def test_schedule_analysis_progress_is_throttled(self, mock_monotonic):
+        """Test that progress updates closer together than the interval are dropped"""
+        selector, mock_parent, mock_model_manager, mock_logger = self._create_photo_selector_with_mocks()
+        mock_parent.after.reset_mock()
+        
+        mock_monotonic.side_effect = [100.0, 100.01, 100.1]
+        for i in range(3):
+            selector.schedule_analysis_progress(i, 3)
+        
+        self.assertEqual(mock_parent.after.call_args_list, [
+            call(0, selector.show_analysis_progress, 0, 3),
+            call(0, selector.show_analysis_progress, 2, 3)
+        ])
     
     def test_get_analyzed_photos(self):
         """Test getting analyzed photos"""
@@ -155,6 +178,27 @@ class TestPhotoSelectorAdvanced(unittest.TestCase):
         
         self.assertEqual(result, test_analyzed_photos)
     
+    def test_load_facebook_photos_skips_missing_files(self):
+        """Test that only Facebook photos present on disk are loaded, in order"""
+        selector, mock_parent, mock_model_manager, mock_logger = self._create_photo_selector_with_mocks()
+        
+        facebook_photos = [
+            {'local_path': self.test_images[0]},
+            {'local_path': str(Path(self.test_dir) / "missing.jpg")},
+            {'uri': 'photos/no_local_copy.jpg'},
+            {'local_path': self.test_images[2]}
+        ]
+        
+        # Run the background check and the Tk hand-off inline
+        selector.io_executor = MagicMock()
+        selector.io_executor.submit.side_effect = lambda func: func()
+        mock_parent.after.side_effect = lambda delay, func, *args: func(*args)
+        
+        selector.load_facebook_photos(facebook_photos)
+        
+        self.assertEqual(selector.uploaded_photos, [self.test_images[0], self.test_images[2]])
+        selector.upload_status.set.assert_any_call("2 Facebook photos loaded")
+    
     def test_clear_results_display(self):
         """Test clearing results display"""
         selector, mock_parent, mock_model_manager, mock_logger = self._create_photo_selector_with_mocks()
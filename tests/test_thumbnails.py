@@ -0,0 +1,60 @@
+"""
+Unit tests for the thumbnail cache
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from src.utils.thumbnails import load_thumbnail
+
+
+class TestThumbnails(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.photo_path = str(Path(self.test_dir) / "photo.png")
+        Image.new('RGB', (400, 300), 'red').save(self.photo_path)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_thumbnail_fits_size(self):
+        """Test that the thumbnail keeps the aspect ratio within the requested size"""
+        thumbnail = load_thumbnail(self.photo_path, (100, 100))
+        
+        self.assertEqual(thumbnail.size, (100, 75))
+    
+    def test_unchanged_photo_is_decoded_once(self):
+        """Test that an unchanged photo returns the cached thumbnail"""
+        first = load_thumbnail(self.photo_path, (100, 100))
+        
+        self.assertIs(load_thumbnail(self.photo_path, (100, 100)), first)
+        self.assertIsNot(load_thumbnail(self.photo_path, (150, 150)), first)
+    
+    def test_changed_photo_is_decoded_again(self):
+        """Test that editing a photo invalidates its cached thumbnail"""
+        first = load_thumbnail(self.photo_path, (100, 100))
+        
+        Image.new('RGB', (200, 200), 'blue').save(self.photo_path)
+        stat = os.stat(self.photo_path)
+        os.utime(self.photo_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        second = load_thumbnail(self.photo_path, (100, 100))
+        self.assertIsNot(second, first)
+        self.assertEqual(second.size, (100, 100))
+    
+    def test_missing_photo_raises(self):
+        """Test that a missing photo raises instead of caching a failure"""
+        with self.assertRaises(OSError):
+            load_thumbnail(str(Path(self.test_dir) / "missing.png"), (100, 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file